@@ -18,6 +18,8 @@ from syft.core.node.new.context import UnauthedServiceContext
 from syft.core.node.new.credentials import UserLoginCredentials
 from syft.core.node.new.node import NewNode
 from syft.core.node.new.node_metadata import NodeMetadataJSON
+from syft.core.node.new.response import TAGGED_RESPONSE_MEDIA_TYPE
+from syft.core.node.new.response import encode_tagged_response
 from syft.core.node.new.user import UserPrivateKey
 from syft.core.node.new.user_service import UserService
 from syft.telemetry import TRACE_MODE
@@ -65,9 +67,14 @@ def syft_new_api(request: Request) -> Response:
         return handle_syft_new_api()
 
 
-def handle_new_api_call(data: bytes) -> Response:
+def handle_new_api_call(data: bytes, tagged: bool = False) -> Response:
     obj_msg = deserialize(blob=data, from_bytes=True)
     result = worker.handle_api_call(api_call=obj_msg)
+    if tagged:
+        return Response(
+            encode_tagged_response(result),
+            media_type=TAGGED_RESPONSE_MEDIA_TYPE,
+        )
     return Response(
         serialize(result, to_bytes=True),
         media_type="application/octet-stream",
@@ -77,15 +84,16 @@ def handle_new_api_call(data: bytes) -> Response:
 # make a request to the SyftAPI
 @router.post("/api_call")
 def syft_new_api_call(request: Request, data: bytes = Depends(get_body)) -> Response:
+    tagged = TAGGED_RESPONSE_MEDIA_TYPE in request.headers.get("accept", "")
     if TRACE_MODE:
         with trace.get_tracer(syft_new_api_call.__module__).start_as_current_span(
             syft_new_api_call.__qualname__,
             context=extract(request.headers),
             kind=trace.SpanKind.SERVER,
         ):
-            return handle_new_api_call(data)
+            return handle_new_api_call(data, tagged)
     else:
-        return handle_new_api_call(data)
+        return handle_new_api_call(data, tagged)
 
 
 def handle_login(email: str, password: str, node: NewNode) -> Any:
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 # stdlib
+from functools import lru_cache
 from functools import partial
+import math
 import os
 from pathlib import Path
 import time
@@ -17,6 +19,7 @@ from typing import Tuple
 from typing_extensions import Final
 
 # relative
+from ...logger import debug
 from ...logger import info
 
 if TYPE_CHECKING:
@@ -53,19 +56,14 @@ def convert_constants_to_indices(rdp_constant_array: np.ndarray) -> np.ndarray:
 
     MAKE SURE THERE ARE NO ZEROS IN THE CACHE!!
     """
-    # Find indices for all RDP constants <= 50
-    sub50_mask = rdp_constant_array <= 50
-    # np.maximum is to avoid negative indices when rdp_constant_array is < 1
-    sub50_indices = np.maximum(
-        ((rdp_constant_array * sub50_mask * 10_000) - 1), 0
-    ).astype(int)
-
-    # Find indices for all RDP constants > 50
-    gt50_mask = rdp_constant_array > 50
-    gt50_indices = ((rdp_constant_array - 51 + 500_000) * gt50_mask).astype(int)
-
-    # We should be able to do a straight addition because
-    return sub50_indices + gt50_indices
+    # RDP constants <= 50 map onto the dense part of the cache, everything above
+    # onto the sparse part. np.maximum is to avoid negative indices when
+    # rdp_constant_array is < 1
+    return np.where(
+        rdp_constant_array <= 50,
+        np.maximum(rdp_constant_array * 10_000 - 1, 0),
+        rdp_constant_array - 51 + 500_000,
+    ).astype(np.int64)
 
 
 def get_cache_path(cache_filename: str) -> str:
@@ -78,7 +76,10 @@ def load_cache(filename: str) -> np.ndarray:
     CACHE_PATH = get_cache_path(filename)
     if not os.path.exists(CACHE_PATH):
         raise Exception(f"Cannot load {CACHE_PATH}")
-    cache_array = np.load(CACHE_PATH)
+    # memory map the cache so pages are only read in (and shared between
+    # processes) as lookups touch them. The values stay float64 as they are
+    # compared directly against user budgets.
+    cache_array = np.load(CACHE_PATH, mmap_mode="r")
     info(f"Loaded constant2epsilon cache of size: {cache_array.shape}")
     return cache_array
 
@@ -112,16 +113,80 @@ def map_dsa_to_rdp_constants(
     rdp_constants: Dict[str, np.ndarray],
 ) -> Dict[str, np.ndarray]:
     """Convert data subject array to data subject index array."""
+    # new data subjects are stored as they are, the known ones are accumulated in
+    # one vectorized add instead of one numpy add per data subject
+    known_names = []
+    known_rdp_constants = []
     for data_subject_name, rdp_constant in data_subject_rdp_constants.items():
-        rdp_constants[data_subject_name] = (
-            rdp_constants.get(data_subject_name, 0) + rdp_constant
+        if data_subject_name in rdp_constants:
+            known_names.append(data_subject_name)
+            known_rdp_constants.append(rdp_constant)
+        else:
+            rdp_constants[data_subject_name] = np.array(rdp_constant)
+
+    if known_names:
+        accumulated = np.add(
+            [rdp_constants[name] for name in known_names], known_rdp_constants
         )
+        rdp_constants.update(zip(known_names, accumulated))
 
     return rdp_constants
 
 
-@partial(jax.jit, static_argnums=1)
+def _next_power_of_2(n: int) -> int:
+    return 1 << max(n - 1, 0).bit_length()
+
+
+def _bucket_rdp_params(rdp_params: RDPParams) -> Tuple[RDPParams, Optional[int]]:
+    # returns the padded params and the batch size to slice the results back to,
+    # or the params unchanged and None when there is nothing to pad
+    fields = (
+        rdp_params.sigmas,
+        rdp_params.l2_norms,
+        rdp_params.l2_norm_bounds,
+        rdp_params.Ls,
+    )
+    batch_sizes = {np.shape(field)[0] for field in fields if np.ndim(field) == 1}
+    if any(np.ndim(field) > 1 for field in fields) or len(batch_sizes) != 1:
+        # scalars, or shapes we don't know how to pad
+        return rdp_params, None
+
+    batch_size = batch_sizes.pop()
+    bucket_size = _next_power_of_2(batch_size)
+    if bucket_size == batch_size:
+        return rdp_params, None
+
+    def pad(field: Any, value: float) -> Any:
+        if np.ndim(field) == 0:
+            return field
+        return jnp.pad(field, (0, bucket_size - batch_size), constant_values=value)
+
+    padded_params = RDPParams(
+        sigmas=pad(rdp_params.sigmas, 1),
+        l2_norms=pad(rdp_params.l2_norms, 0),
+        l2_norm_bounds=pad(rdp_params.l2_norm_bounds, 0),
+        Ls=pad(rdp_params.Ls, 0),
+    )
+    return padded_params, batch_size
+
+
 def compute_rdp_constant(rdp_params: RDPParams, private: bool) -> jax.numpy.DeviceArray:
+    """
+    Batches of RDPParams are padded up to the next power of two, so that batches of
+    different sizes reuse a handful of compiled traces instead of triggering a new one
+    for every size. The padding has l2 norms and Ls of 0, so its constants are 0, and
+    is sliced off again before returning.
+    """
+    padded_params, batch_size = _bucket_rdp_params(rdp_params)
+    if batch_size is None:
+        return _compute_rdp_constant(rdp_params, private)
+    return _compute_rdp_constant(padded_params, private)[:batch_size]
+
+
+@partial(jax.jit, static_argnums=1)
+def _compute_rdp_constant(
+    rdp_params: RDPParams, private: bool
+) -> jax.numpy.DeviceArray:
     squared_Ls = rdp_params.Ls**2
     squared_sigma = rdp_params.sigmas**2
 
@@ -135,8 +200,41 @@ def compute_rdp_constant(rdp_params: RDPParams, private: bool) -> jax.numpy.Devi
     return squared_Ls * squared_l2 / (2 * squared_sigma)
 
 
+def rdp_params_to_eps(
+    rdp_params: RDPParams, cache: jnp.ndarray, private: bool
+) -> Tuple[jax.numpy.DeviceArray, jax.numpy.DeviceArray]:
+    """
+    Fuses compute_rdp_constant, convert_constants_to_indices and the cache lookup into a single kernel.
+
+    Returns the RDP constants along with their epsilon spend. Constants past the end of the
+    cache gather NaN, callers need to fall back to DataSubjectLedger._get_epsilon_spend for those.
+    Batches are bucketed to powers of two like compute_rdp_constant, so the kernel is only
+    traced for a handful of sizes.
+    """
+    padded_params, batch_size = _bucket_rdp_params(rdp_params)
+    if batch_size is None:
+        return _rdp_params_to_eps(rdp_params, cache, private)
+    rdp_constant, eps_spend = _rdp_params_to_eps(padded_params, cache, private)
+    return rdp_constant[:batch_size], eps_spend[:batch_size]
+
+
+@partial(jax.jit, static_argnums=2)
+def _rdp_params_to_eps(
+    rdp_params: RDPParams, cache: jnp.ndarray, private: bool
+) -> Tuple[jax.numpy.DeviceArray, jax.numpy.DeviceArray]:
+    # the params are already bucketed, so this doesn't pad again
+    rdp_constant = compute_rdp_constant(rdp_params, private)
+    indices = jnp.where(
+        rdp_constant <= 50,
+        jnp.maximum(rdp_constant * 10_000 - 1, 0),
+        rdp_constant - 51 + 500_000,
+    ).astype(jnp.int64)
+    # take fills out of bounds indices with NaN
+    return rdp_constant, jnp.take(cache, indices)
+
+
 @jax.jit
-def get_budgets_and_mask(
+def _get_budgets_and_mask_jax(
     epsilon_spend: jnp.array, user_budget: jnp.float64
 ) -> Tuple[float, float, jax.numpy.DeviceArray]:
     # Function to vectorize the result of the budget computation.
@@ -146,6 +244,125 @@ def get_budgets_and_mask(
     return (highest_possible_spend, user_budget, mask)
 
 
+def get_budgets_and_mask(
+    epsilon_spend: np.ndarray, user_budget: float, use_jax: bool = False
+) -> Tuple[float, float, np.ndarray]:
+    # a compare and a max are far cheaper in numpy than the jit dispatch, so
+    # only go through jax when the spend already lives on an accelerator
+    if use_jax:
+        return _get_budgets_and_mask_jax(epsilon_spend, user_budget)
+
+    epsilon_spend = np.asarray(epsilon_spend)
+    mask = epsilon_spend > user_budget
+    # get the highest value which was under budget and represented by False in the mask
+    highest_possible_spend = float(np.max(epsilon_spend, where=~mask, initial=0.0))
+    return (highest_possible_spend, user_budget, mask)
+
+
+def get_fake_rdp_func(constant: float) -> Callable:
+    def func(alpha: float) -> float:
+        return alpha * constant
+
+    return func
+
+
+def get_alpha_search_function(rdp_compose_func: Callable, log_delta: float) -> Callable:
+    # fun is evaluated on python scalars by the Brent search, so use math rather
+    # than paying for numpy's dispatch on every evaluation
+    neg_log_delta = -log_delta
+
+    def fun(alpha: float) -> float:  # the input is the RDP's \alpha
+        if alpha <= 1:
+            return math.inf
+        else:
+            alpha_minus_1 = alpha - 1
+            return max(
+                rdp_compose_func(alpha)
+                + math.log(alpha_minus_1 / alpha)
+                + (neg_log_delta - math.log(alpha)) / alpha_minus_1,
+                0.0,
+            )
+
+    return fun
+
+
+def _optimal_alpha_eps_newton(constant: float, log_delta: float) -> Tuple[float, float]:
+    # scalar version of compute_optimal_alpha_and_epsilon, see there for the derivation
+    alpha = 1 + math.sqrt(-log_delta / constant)
+    for _ in range(50):
+        g = constant * (alpha - 1) ** 2 + log_delta + math.log(alpha)
+        step = g / (2 * constant * (alpha - 1) + 1 / alpha)
+        alpha = max(alpha - step, (alpha + 1) / 2)
+        if abs(step) <= 1e-12 * (alpha - 1):
+            break
+
+    alpha_minus_1 = alpha - 1
+    eps = max(
+        constant * alpha
+        + math.log(alpha_minus_1 / alpha)
+        - (log_delta + math.log(alpha)) / alpha_minus_1,
+        0.0,
+    )
+    return alpha, eps
+
+
+@lru_cache(maxsize=1 << 16)
+def _optimal_alpha_eps(constant: float, log_delta: float) -> Tuple[float, float]:
+    # memoized since big RDP constants past the cache tend to be queried repeatedly
+    if constant > 700_050:
+        # past the cache the optimum is found directly from the closed form
+        # derivative, which takes a handful of steps instead of a Brent search
+        return _optimal_alpha_eps_newton(constant=constant, log_delta=log_delta)
+
+    f = get_fake_rdp_func(constant=constant)
+    f2 = get_alpha_search_function(rdp_compose_func=f, log_delta=log_delta)
+    results = minimize_scalar(
+        f2,
+        method="Brent",
+        bracket=(1, 2),  # bounds=[1, np.inf]
+    )
+
+    return results.x, results.fun
+
+
+@jax.jit
+def compute_optimal_alpha_and_epsilon(
+    constants: jnp.ndarray, log_delta: float
+) -> Tuple[jax.numpy.DeviceArray, jax.numpy.DeviceArray]:
+    """
+    Vectorized equivalent of DataSubjectLedger._get_optimal_alpha_for_constant for RDP constants >= 1.
+
+    The derivative of the alpha search function simplifies to c + (log_delta + log(alpha)) / (alpha - 1)**2,
+    so the optimal alpha is the root of g(alpha) = c * (alpha - 1)**2 + log_delta + log(alpha), which is
+    monotonically increasing for alpha > 1. Newton's method on g is started at the asymptotic optimum
+    alpha = 1 + sqrt(-log_delta / c), which always lies to the right of the root.
+    """
+    constants = jnp.asarray(constants, dtype=jnp.float64)
+
+    def cond(state: Tuple) -> bool:
+        i, alpha, step = state
+        return (i < 50) & jnp.any(jnp.abs(step) > 1e-12 * (alpha - 1))
+
+    def body(state: Tuple) -> Tuple:
+        i, alpha, _ = state
+        g = constants * (alpha - 1) ** 2 + log_delta + jnp.log(alpha)
+        step = g / (2 * constants * (alpha - 1) + 1 / alpha)
+        # never step more than halfway towards alpha = 1
+        return i + 1, jnp.maximum(alpha - step, (alpha + 1) / 2), step
+
+    alpha_0 = 1 + jnp.sqrt(-log_delta / constants)
+    _, alpha, _ = jax.lax.while_loop(cond, body, (0, alpha_0, jnp.ones_like(alpha_0)))
+
+    alpha_minus_1 = alpha - 1
+    epsilon = jnp.maximum(
+        constants * alpha
+        + jnp.log(alpha_minus_1 / alpha)
+        - (log_delta + jnp.log(alpha)) / alpha_minus_1,
+        0,
+    )
+    return alpha, epsilon
+
+
 @serializable(recursive_serde=True)
 class DataSubjectLedger(AbstractDataSubjectLedger):
     """for a particular data subject, this is the list
@@ -159,7 +376,13 @@ class DataSubjectLedger(AbstractDataSubjectLedger):
     ]
 
     CONSTANT2EPSILSON_CACHE_FILENAME = "constant2epsilon_1200k.npy"
-    _cache_constant2epsilon = load_cache(filename=CONSTANT2EPSILSON_CACHE_FILENAME)
+    # lookups larger than this are deduplicated before gathering from the cache
+    DEDUPLICATE_LOOKUP_THRESHOLD = 4096
+    # log of the fixed delta below, precomputed since delta never changes
+    _LOG_DELTA: Final = math.log(1e-6)
+
+    _cache: Optional[np.ndarray] = None
+    _device_cache: Optional[jnp.ndarray] = None
 
     def __init__(
         self,
@@ -185,6 +408,36 @@ class DataSubjectLedger(AbstractDataSubjectLedger):
             and self._rdp_constants == other._rdp_constants
         )
 
+    @classmethod
+    def get_cache(cls) -> np.ndarray:
+        # loaded on first use so importing this module doesn't read the cache
+        if DataSubjectLedger._cache is None:
+            DataSubjectLedger._cache = load_cache(
+                filename=DataSubjectLedger.CONSTANT2EPSILSON_CACHE_FILENAME
+            )
+        return DataSubjectLedger._cache
+
+    @classmethod
+    def get_device_cache(cls) -> jnp.ndarray:
+        # the cache is only transferred to the device once
+        if DataSubjectLedger._device_cache is None:
+            DataSubjectLedger._device_cache = jnp.asarray(cls.get_cache())
+        return DataSubjectLedger._device_cache
+
+    @property
+    def _cache_constant2epsilon(self) -> np.ndarray:
+        # ledgers which had to grow the cache keep their own extended copy, which
+        # may have spare capacity past the entries that have been filled in
+        extended_cache = getattr(self, "_extended_cache", None)
+        if extended_cache is None:
+            return self.get_cache()
+        return extended_cache[: self._extended_cache_size]
+
+    @_cache_constant2epsilon.setter
+    def _cache_constant2epsilon(self, value: np.ndarray) -> None:
+        self._extended_cache = value
+        self._extended_cache_size = len(value)
+
     @property
     def delta(self) -> float:
         FIXED_DELTA: Final = 1e-6
@@ -256,19 +509,24 @@ class DataSubjectLedger(AbstractDataSubjectLedger):
             raise e
 
     def _increase_max_cache(self, new_size: int) -> None:
-        new_entries = []
-        current_size = len(self._cache_constant2epsilon)
-        new_alphas = []
-        for i in range(new_size - current_size):
-            alph, eps = self._get_optimal_alpha_for_constant(
-                constant=i + 1 + current_size
-            )
-            new_entries.append(eps)
-            new_alphas.append(alph)
-
-        self._cache_constant2epsilon = np.concatenate(
-            [self._cache_constant2epsilon, np.array(new_entries)]
-        )
+        current_cache = self._cache_constant2epsilon
+        current_size = len(current_cache)
+        if new_size <= current_size:
+            return None
+
+        extended_cache = getattr(self, "_extended_cache", None)
+        if extended_cache is None or len(extended_cache) < new_size:
+            # grow geometrically so repeated cache misses don't copy the whole
+            # cache every time
+            capacity = max(new_size, int(current_size * 1.5))
+            extended_cache = np.empty(capacity, dtype=np.float64)
+            extended_cache[:current_size] = current_cache
+            self._extended_cache = extended_cache
+
+        constants = np.arange(current_size + 1, new_size + 1, dtype=np.float64)
+        _, new_entries = compute_optimal_alpha_and_epsilon(constants, self._LOG_DELTA)
+        extended_cache[current_size:new_size] = new_entries
+        self._extended_cache_size = new_size
 
     def _fetch_eps_spend_for_big_rdp(
         self, big_rdp_constant: np.ndarray, indices: np.ndarray
@@ -277,59 +535,23 @@ class DataSubjectLedger(AbstractDataSubjectLedger):
         We only use this when the RDP constant is large enough that extending the cache would take too long.
         As of Nov 21, 2022, we decided the cutoff would be the current cache size + 150,000
         """
-        # There may be a vectorized way of doing this using jnp.take() and cacheable as a boolean mask
+        rdp_constants = np.ravel(big_rdp_constant)
+        indices = np.ravel(indices)
 
-        eps_values = []
         # filter values that are cache-able
-        cacheable = (
-            big_rdp_constant <= 700_050
-        )  # TODO: Replace this with a class variable
-        cacheable = cacheable.flatten()
-        rdp_constants = big_rdp_constant.flatten()
-
-        for is_cacheable, constant, index in zip(cacheable, rdp_constants, indices):
-            if is_cacheable:
-                eps = self._cache_constant2epsilon[index]
-            else:
-                _, eps = self._get_optimal_alpha_for_constant(constant)
-            eps_values.append(eps)
-        return jnp.array(eps_values).reshape(big_rdp_constant.shape)
-
-    def _get_fake_rdp_func(self, constant: int) -> Callable:
-        def func(alpha: float) -> float:
-            return alpha * constant
-
-        return func
+        cacheable = rdp_constants <= 700_050  # TODO: Replace this with a class variable
 
-    def _get_alpha_search_function(self, rdp_compose_func: Callable) -> Callable:
-        log_delta = np.log(self.delta)
+        eps_values = np.empty(rdp_constants.size, dtype=np.float64)
+        # a single gather for everything the cache covers
+        eps_values[cacheable] = self._cache_constant2epsilon[indices[cacheable]]
+        # only the (typically few) uncacheable constants are solved directly
+        for i in np.flatnonzero(~cacheable):
+            _, eps_values[i] = self._get_optimal_alpha_for_constant(rdp_constants[i])
 
-        def fun(alpha: float) -> float:  # the input is the RDP's \alpha
-            if alpha <= 1:
-                return np.inf
-            else:
-                alpha_minus_1 = alpha - 1
-                return np.maximum(
-                    rdp_compose_func(alpha)
-                    + np.log(alpha_minus_1 / alpha)
-                    - (log_delta + np.log(alpha)) / alpha_minus_1,
-                    0,
-                )
+        return eps_values.reshape(np.shape(big_rdp_constant))
 
-        return fun
-
-    def _get_optimal_alpha_for_constant(
-        self, constant: int = 3
-    ) -> Tuple[np.ndarray, Callable]:
-        f = self._get_fake_rdp_func(constant=constant)
-        f2 = self._get_alpha_search_function(rdp_compose_func=f)
-        results = minimize_scalar(
-            f2,
-            method="Brent",
-            bracket=(1, 2),  # bounds=[1, np.inf]
-        )
-
-        return results.x, results.fun
+    def _get_optimal_alpha_for_constant(self, constant: int = 3) -> Tuple[float, float]:
+        return _optimal_alpha_eps(float(constant), self._LOG_DELTA)
 
     def update_rdp_constants(self, data_subject_rdp_constants: Dict) -> None:
         self._rdp_constants = map_dsa_to_rdp_constants(
@@ -350,34 +572,45 @@ class DataSubjectLedger(AbstractDataSubjectLedger):
 
     def _get_epsilon_spend(self, rdp_constants: np.ndarray) -> np.ndarray:
         rdp_constants_lookup = convert_constants_to_indices(rdp_constants)
-        if rdp_constants_lookup.max() - len(self._cache_constant2epsilon) >= 150_000:
+        lookup_max = int(rdp_constants_lookup.max())
+        cache_size = len(self._cache_constant2epsilon)
+        if lookup_max - cache_size >= 150_000:
             eps_spend = self._fetch_eps_spend_for_big_rdp(
                 rdp_constants, rdp_constants_lookup
             )
         else:
-            try:
-                # needed as np.int64 to use take
-                eps_spend = jax.jit(jnp.take)(
-                    self._cache_constant2epsilon, rdp_constants_lookup
-                )
-
-                # take no longer wraps which was probably wrong:
-                # https://github.com/google/jax/commit/0b470361dac51fb4f5ab2f720f1cf35e442db005
-                # now we should expect NaN when the max rdp_constants_lookup is higher
-                # than the length of self._cache_constant2epsilon
-                # we could also check the max head of time if its faster than checking the
-                # output for NaNs
-                if jnp.isnan(eps_spend).any():
-                    raise ValueError("NaNs from RDP Lookup, we need to recalculate")
-
-            except (ValueError, IndexError):
-                print(f"Cache missed the value at {max(rdp_constants_lookup)}")
-                self._increase_max_cache(int(max(rdp_constants_lookup) * 1.1))
-                eps_spend = jax.jit(jnp.take)(
-                    self._cache_constant2epsilon, rdp_constants_lookup
+            # the indices are never negative, so the only way to miss the cache is
+            # to look past its end. Check for that up front instead of checking
+            # the gathered values for NaNs afterwards.
+            if lookup_max >= cache_size:
+                print(f"Cache missed the value at {lookup_max}")
+                self._increase_max_cache(int(lookup_max * 1.1))
+            if rdp_constants_lookup.size > self.DEDUPLICATE_LOOKUP_THRESHOLD:
+                # many data subjects tend to share the same RDP constants, so only
+                # gather the unique ones and scatter them back
+                unique_lookup, inverse = np.unique(
+                    rdp_constants_lookup, return_inverse=True
                 )
+                eps_spend = self._cache_constant2epsilon[unique_lookup][
+                    inverse
+                ].reshape(rdp_constants_lookup.shape)
+            else:
+                eps_spend = self._cache_constant2epsilon[rdp_constants_lookup]
         return eps_spend
 
+    def _get_rdp_constant_and_epsilon_spend(
+        self, rdp_params: RDPParams, private: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        rdp_constant, eps_spend = rdp_params_to_eps(
+            rdp_params, self.get_device_cache(), private
+        )
+        rdp_constant = np.asarray(rdp_constant)
+        eps_spend = np.asarray(eps_spend)
+        if np.isnan(eps_spend).any():
+            # some constants are past the end of the cache
+            eps_spend = self._get_epsilon_spend(rdp_constant)
+        return rdp_constant, eps_spend
+
     def _calculate_mask_for_current_budget(
         self, get_budget_for_user: Callable, epsilon_spend: np.ndarray
     ) -> Tuple[float, float, np.ndarray]:
@@ -405,14 +638,18 @@ class DataSubjectLedger(AbstractDataSubjectLedger):
         mask = np.array(mask, copy=False)
         highest_possible_spend = float(highest_possible_spend)
         user_budget = float(user_budget)
-        print("Epsilon spend ", epsilon_spend)
-        print("Highest possible spend ", highest_possible_spend)
+        # lazy args, so the (potentially huge) spend array is only formatted
+        # when debug logging is enabled
+        debug("Epsilon spend {}", lambda: epsilon_spend)
+        debug("Highest possible spend {}", lambda: highest_possible_spend)
         if highest_possible_spend > 0:
             # go spend it in the db
             attempts = 0
             while attempts < 5:
-                print(
-                    f"Attemping to spend epsilon: {highest_possible_spend}. Try: {attempts}"
+                debug(
+                    "Attemping to spend epsilon: {}. Try: {}",
+                    lambda: highest_possible_spend,
+                    lambda: attempts,
                 )
                 attempts += 1
                 try:
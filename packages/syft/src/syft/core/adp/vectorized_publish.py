@@ -22,7 +22,6 @@ from ...core.tensor.fixed_precision_tensor import FixedPrecisionTensor
 from ..tensor.passthrough import PassthroughTensor  # type: ignore
 from .data_subject_ledger import DataSubjectLedger
 from .data_subject_ledger import RDPParams
-from .data_subject_ledger import compute_rdp_constant
 
 if TYPE_CHECKING:
     # relative
@@ -159,8 +158,9 @@ def compute_epsilon(
     # one to keep the same formula for the linear queries
     lipschitz_bound = 1 if is_linear else tensor.lipschitz_bound
 
-    # compute the rdp constant for each phi tensor
+    # compute the rdp constant and epsilon for each phi tensor
     rdp_constants = {}
+    epsilons = {}
     for phi_tensor_id in phi_tensors:
         # TODO 0.8: figure a way to iterate over data_subjects and group phi_tensors when computing
         # the Lipschitz bound
@@ -190,17 +190,11 @@ def compute_epsilon(
             l2_norm_bounds=l2_norm_bounds,
             Ls=lipschitz_bound,
         )
-        rdp_constants[phi_tensor_id] = compute_rdp_constant(
+        rdp_constant, eps_spend = ledger._get_rdp_constant_and_epsilon_spend(
             rdp_params=param, private=private
         )
-
-    # get epsilon for each tensor based on the rdp constant
-    epsilons = {
-        phi_tensor_id: ledger._get_epsilon_spend(
-            np.array([rdp_constants[phi_tensor_id]])
-        )  # this is kinda dumb
-        for phi_tensor_id in phi_tensors
-    }
+        rdp_constants[phi_tensor_id] = rdp_constant
+        epsilons[phi_tensor_id] = np.reshape(eps_spend, (1,))
 
     filtered = {eps: epsilons[eps] <= privacy_budget for eps in epsilons}
     epsilon_spend = max([epsilons[eps_id] * filtered[eps_id] for eps_id in epsilons])
@@ -11,8 +11,35 @@ from ....experimental_flags import flags
 from .deserialize import _deserialize
 from .serialize import _serialize
 
+# below this many bytes the arrow tensor and ipc framing cost more than the
+# data, so the raw bytes are written with the shape and dtype instead
+SMALL_ARRAY_NBYTES = 64
+
+# fixed width kinds whose dtype.str describes them fully: bool, int, uint,
+# float, complex, timedelta, datetime, bytes and str. a structured dtype comes
+# back as void ('|V4') without its field names and objects have no raw bytes
+RAW_DTYPE_KINDS = "biufcmMSU"
+
+
+def use_raw_bytes(obj: np.ndarray) -> bool:
+    if obj.dtype.kind not in RAW_DTYPE_KINDS:
+        return False
+    if obj.nbytes < SMALL_ARRAY_NBYTES:
+        return True
+    # larger arrays skip arrow too unless it would compress them, tobytes of a
+    # C contiguous array is a single copy of its buffer
+    return (
+        flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE
+        and obj.flags["C_CONTIGUOUS"]
+    )
+
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
+    if use_raw_bytes(obj):
+        return cast(
+            bytes, _serialize((obj.tobytes(), obj.shape, obj.dtype.str), to_bytes=True)
+        )
+
     original_dtype = obj.dtype
     apache_arrow = pa.Tensor.from_numpy(obj=obj)
     sink = pa.BufferOutputStream()
@@ -31,9 +58,15 @@ def arrow_serialize(obj: np.ndarray) -> bytes:
 
 def arrow_deserialize(buf: bytes) -> np.ndarray:
     (numpy_bytes, decompressed_size, dtype) = _deserialize(buf, from_bytes=True)
+    if not isinstance(decompressed_size, int):
+        # raw bytes, see use_raw_bytes, decompressed_size holds the shape
+        raw_array = np.frombuffer(numpy_bytes, dtype=np.dtype(dtype))
+        # copied so the array is writable like the arrow path
+        return raw_array.reshape(decompressed_size).copy()
+
     original_dtype = np.dtype(dtype)
     if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
-        reader = pa.BufferReader(buf)
+        reader = pa.BufferReader(numpy_bytes)
         numpy_bytes = reader.read_buffer()
     else:
         numpy_bytes = pa.decompress(
@@ -43,6 +76,6 @@ def arrow_deserialize(buf: bytes) -> np.ndarray:
         )
 
     result = pa.ipc.read_tensor(numpy_bytes)
-    np_array = result.to_numpy()
-    np_array.setflags(write=True)
-    return np_array.astype(original_dtype)
+    # astype copies, so the result is writable even though the arrow buffer
+    # is backed by immutable bytes
+    return result.to_numpy().astype(original_dtype)
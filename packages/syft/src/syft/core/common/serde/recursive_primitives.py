@@ -227,6 +227,12 @@ recursive_serde_register(
     deserialize=functools.partial(deserialize_iterable, set),
 )
 
+recursive_serde_register(
+    frozenset,
+    serialize=serialize_iterable,
+    deserialize=functools.partial(deserialize_iterable, frozenset),
+)
+
 recursive_serde_register(
     complex,
     serialize=lambda x: serialize_iterable((x.real, x.imag)),
@@ -47,6 +47,7 @@ class AbstractNodeClient(Address):
 class AbstractNode(Address):
     name: Optional[str]
     signing_key: Optional[SigningKey]
+    signing_key_hex: str
     guest_signing_key_registry: Set[SigningKey]
     guest_verify_key_registry: Set[VerifyKey]
     admin_verify_key_registry: Set[VerifyKey]
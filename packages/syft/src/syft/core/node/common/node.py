@@ -2,11 +2,21 @@
 from __future__ import annotations
 
 # stdlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from functools import lru_cache
+import itertools
+from operator import itemgetter
 import os
+import threading
 from typing import Any
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -27,7 +37,6 @@ from ....logger import traceback_and_raise
 from ....shylock import ShylockPymongoBackend
 from ....shylock import configure
 from ....telemetry import instrument
-from ....util import get_subclasses
 from ...common.message import ImmediateSyftMessageWithReply
 from ...common.message import ImmediateSyftMessageWithoutReply
 from ...common.message import SignedImmediateSyftMessageWithReply
@@ -39,6 +48,7 @@ from ...io.location import Location
 from ...io.route import Route
 from ...io.route import SoloRoute
 from ...io.virtual import create_virtual_connection
+from ...store import ObjectStore
 from ..abstract.node import AbstractNode
 from ..common.exceptions import OblvEnclaveError
 from ..common.exceptions import OblvEnclaveUnAuthorizedError
@@ -80,6 +90,11 @@ from .node_service.resolve_pointer_type.resolve_pointer_type_service import (
 from .node_service.testing_services.repr_service import ReprService
 from .node_service.vpn.vpn_messages import VPNRegisterMessage
 from .node_table.node import NoSQLNode
+from .node_table.node import NoSQLNodeRoute
+
+if TYPE_CHECKING:
+    # third party
+    from pymongo import MongoClient
 
 # this generic type for Client bound by Client
 ClientT = TypeVar("ClientT", bound=Client)
@@ -93,6 +108,23 @@ class DuplicateRequestException(Exception):
 NODE_PRIVATE_KEY = "NODE_PRIVATE_KEY"
 NODE_UID = "NODE_UID"
 
+# number of threads used to connect to the peers in reload_peer_clients
+PEER_INIT_THREADS = int(os.environ.get("SYFT_PEER_INIT_THREADS", 4))
+
+# the order in which routes to a peer are preferred, lower is better
+SECURITY_PRIORITY = {"vpn": 0, "https": 1, "http": 2}
+
+# Oblv exceptions are safe to send back to the client as they are
+_OBLV_EXCEPTIONS = (
+    OblvKeyNotFoundError,
+    OblvProxyConnectPCRError,
+    OblvEnclaveUnAuthorizedError,
+    OblvEnclaveError,
+)
+
+# message types which are processed without checking their signature
+_ALLOWED_UNSIGNED_MESSAGES: FrozenSet[type] = frozenset((VPNRegisterMessage,))
+
 
 def get_private_key_env() -> Optional[str]:
     return get_env(NODE_PRIVATE_KEY)
@@ -102,13 +134,21 @@ def get_node_uid_env() -> Optional[str]:
     return get_env(NODE_UID)
 
 
+@lru_cache(maxsize=None)
 def get_env(key: str) -> Optional[str]:
+    # the environment is read once per key, call reset_env_cache after changing it
     value = os.environ.get(key, None)
     return str(value) if value is not None else value
 
 
-signing_key_env = get_private_key_env()
-node_uid_env = get_node_uid_env()
+def reset_env_cache() -> None:
+    get_env.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _signing_key_from_hex(hex_str: str) -> SigningKey:
+    # SigningKey is immutable so nodes created with the same key can share it
+    return SigningKey(bytes.fromhex(hex_str))
 
 
 @instrument
@@ -121,12 +161,80 @@ class Node(AbstractNode):
     Each node is identified by an id of type ID and a name of type string.
     """
 
+    # Address has no __slots__ so instances keep a __dict__ for everything else
+    # (nosql_db_engine, store and setup are cached_properties and need it),
+    # these are the attributes every node sets in __init__
+    __slots__ = (
+        "node_uid",
+        "_id_cached",
+        "signing_key",
+        "root_verify_key",
+        "verify_key",
+        "_vk_bytes",
+        "settings",
+        "_container_host",
+        "db_name",
+        "document_store",
+        "_document_store_configured",
+        "TableBase",
+        "_store_type",
+        "services_registered",
+        "node_type",
+        "immediate_msg_with_reply_router",
+        "immediate_msg_without_reply_router",
+        "immediate_services_without_reply",
+        "immediate_services_with_reply",
+        "signed_message_with_reply_forwarding_service",
+        "signed_message_without_reply_forwarding_service",
+        "allowed_unsigned_messages",
+        "lib_ast",
+        "guest_signing_key_registry",
+        "guest_verify_key_registry",
+        "admin_verify_key_registry",
+        "cpl_ofcr_verify_key_registry",
+        "_peer_clients",
+        "_peer_clients_lock",
+        "signaling_msgs",
+        "message_counter",
+        "_message_counter_iter",
+        "_dispatch_cache",
+    )
+
     client_type = ClientT
     child_type_client_type = ClientT
 
     ChildT = TypeVar("ChildT", bound="Node")
     child_type = ChildT
 
+    # This is the list of services which all node support.
+    # You can read more about them by reading their respective
+    # class documentation.
+
+    # TODO: Support ImmediateNodeServiceWithoutReply Parent Class
+    # for services which run immediately and do not return a reply
+    IMMEDIATE_SERVICES_WITHOUT_REPLY: Tuple[Any, ...] = (
+        ReprService,
+        HeritageUpdateService,
+        ChildNodeLifecycleService,
+        ImmediateObjectActionServiceWithoutReply,
+        ImmediateObjectSearchPermissionUpdateService,
+    )
+
+    # TODO: Support ImmediateNodeServiceWithReply Parent Class
+    # for services which run immediately and return a reply
+    IMMEDIATE_SERVICES_WITH_REPLY: Tuple[Any, ...] = (
+        ImmediateObjectActionServiceWithReply,
+        ImmediateObjectSearchService,
+        GetReprService,
+        ResolvePointerTypeService,
+    )
+
+    _node_type_name = "Node"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._node_type_name = cls.__name__
+
     def __init__(
         self,
         node_uid: Optional[str] = None,
@@ -142,31 +250,27 @@ class Node(AbstractNode):
         settings: Optional[BaseSettings] = None,
         document_store: bool = False,
     ):
-        if node_uid_env is not None:
-            self.node_uid = UID.from_string(node_uid_env)
-        elif node_uid is not None:
-            self.node_uid = UID.from_string(node_uid)
-        else:
-            self.node_uid = UID()
-
-        if self.node_uid is None:
-            raise Exception("self.node_uid is None")
-
-        if signing_key_env is not None:
-            self.signing_key = SigningKey(bytes.fromhex(signing_key_env))
-        elif signing_key is not None:
-            self.signing_key = SigningKey(bytes.fromhex(signing_key))
-        else:
-            self.signing_key = SigningKey.generate()
-
-        if self.signing_key is None:
-            raise Exception("self.signing_key is None")
-        self.root_verify_key = self.signing_key.verify_key
-        self.verify_key = self.signing_key.verify_key
-        print(
-            "============> Starting Node with:",
-            self.node_uid,
-            self.signing_key.encode(encoder=HexEncoder).decode("utf-8"),
+        # the environment takes precedence over the arguments
+        node_uid_hex = get_node_uid_env() or node_uid
+        self.node_uid = UID.from_string(node_uid_hex) if node_uid_hex else UID()
+        # plain attribute for the per message address check
+        self._id_cached = self.node_uid
+
+        signing_key_hex = get_private_key_env() or signing_key
+        self.signing_key = (
+            _signing_key_from_hex(signing_key_hex)
+            if signing_key_hex
+            else SigningKey.generate()
+        )
+        verify_key = self.signing_key.verify_key
+        self.root_verify_key = verify_key
+        self.verify_key = verify_key
+        # the raw public key, stored next to the private key
+        self._vk_bytes = bytes(verify_key)
+        debug(
+            "Starting Node {} with verify key {}",
+            lambda: self.node_uid,
+            lambda: self.verify_key_hex,
         )
 
         # The node has a name - it exists purely to help the
@@ -178,30 +282,15 @@ class Node(AbstractNode):
         )
 
         self.settings = settings
+        self._container_host = settings.CONTAINER_HOST if settings else None
 
-        if self.settings and self.settings.MONGO_USERNAME:
-            # third party
-            from pymongo import MongoClient
-
-            # FIXME: Modify to use environment variable
-            self.nosql_db_engine = MongoClient(  # nosec
-                host=self.settings.MONGO_HOST,
-                port=self.settings.MONGO_PORT,
-                username=self.settings.MONGO_USERNAME,
-                password=self.settings.MONGO_PASSWORD,
-                uuidRepresentation="standard",
-            )
-        else:
-            # third party
-            from pymongo_inmemory import MongoClient
-
-            self.nosql_db_engine = MongoClient(
-                port=27017, uuidRepresentation="standard"
-            )
-
+        # the mongo client (see nosql_db_engine), the store and setup managers
+        # built on it and the document store locks (see ensure_document_store)
+        # are only set up once something needs them. Domain and Network build
+        # their NoSQL managers in __init__, so for them that is at construction
         self.db_name = "app"
-        if document_store:
-            configure(ShylockPymongoBackend.create(self.nosql_db_engine, self.db_name))
+        self.document_store = document_store
+        self._document_store_configured = False
 
         # cache these variables on self
         self.TableBase = TableBase
@@ -218,13 +307,7 @@ class Node(AbstractNode):
         # on a Node if there is a chance that the collections could
         # become quite numerous (or otherwise fill up RAM).
         # self.store is the elastic memory.
-
-        self.store = store_type(
-            settings=settings,
-            nosql_db_engine=self.nosql_db_engine,
-            db_name=self.db_name,
-        )
-        self.setup = NoSQLSetupManager(self.nosql_db_engine, self.db_name)
+        self._store_type = store_type
 
         # We need to register all the services once a node is created
         # On the off chance someone forgot to do this (super unlikely)
@@ -235,7 +318,7 @@ class Node(AbstractNode):
         # which can work for all node types, sometimes we need to have
         # a reference to what node type this node is. This attribute
         # provides that ability.
-        self.node_type = type(self).__name__
+        self.node_type = self._node_type_name
         # ABOUT SERVICES AND MESSAGES
 
         # Each service corresponds to one or more message types which
@@ -269,31 +352,15 @@ class Node(AbstractNode):
             Type[ImmediateSyftMessageWithoutReply], Any
         ] = {}
 
-        # This is the list of services which all node support.
-        # You can read more about them by reading their respective
-        # class documentation.
-
-        # TODO: Support ImmediateNodeServiceWithoutReply Parent Class
-        # for services which run immediately and do not return a reply
-        self.immediate_services_without_reply: List[Any] = []
-        self.immediate_services_without_reply.append(ReprService)
-        self.immediate_services_without_reply.append(HeritageUpdateService)
-        self.immediate_services_without_reply.append(ChildNodeLifecycleService)
-        self.immediate_services_without_reply.append(
-            ImmediateObjectActionServiceWithoutReply
+        # The services which all nodes support are shared on the class, the
+        # node subclasses extend their own copy of the lists in __init__.
+        self.immediate_services_without_reply: List[Any] = list(
+            self.IMMEDIATE_SERVICES_WITHOUT_REPLY
         )
-        self.immediate_services_without_reply.append(
-            ImmediateObjectSearchPermissionUpdateService
+        self.immediate_services_with_reply: List[Any] = list(
+            self.IMMEDIATE_SERVICES_WITH_REPLY
         )
 
-        # TODO: Support ImmediateNodeServiceWithReply Parent Class
-        # for services which run immediately and return a reply
-        self.immediate_services_with_reply: List[Any] = []
-        self.immediate_services_with_reply.append(ImmediateObjectActionServiceWithReply)
-        self.immediate_services_with_reply.append(ImmediateObjectSearchService)
-        self.immediate_services_with_reply.append(GetReprService)
-        self.immediate_services_with_reply.append(ResolvePointerTypeService)
-
         # This is a special service which cannot be listed in any
         # of the other services because it handles messages of all types.
         # Thus, it does not live in a message router since
@@ -311,8 +378,7 @@ class Node(AbstractNode):
             SignedMessageWithoutReplyForwardingService()
         )
 
-        self.allowed_unsigned_messages = []
-        self.allowed_unsigned_messages.append(VPNRegisterMessage)
+        self.allowed_unsigned_messages: FrozenSet[type] = _ALLOWED_UNSIGNED_MESSAGES
 
         # now we need to load the relevant frameworks onto the node
         self.lib_ast = lib_ast
@@ -325,16 +391,76 @@ class Node(AbstractNode):
         self.guest_verify_key_registry = set()
         self.admin_verify_key_registry = set()
         self.cpl_ofcr_verify_key_registry = set()
-        self.peer_route_clients: Dict[UID, Dict[str, Dict[str, Client]]] = {}
+        # (priority, base_url, client) per peer, kept sorted by SECURITY_PRIORITY
+        self._peer_clients: Dict[UID, List[Tuple[int, str, Client]]] = defaultdict(list)
+        self._peer_clients_lock = threading.Lock()
         # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
         self.signaling_msgs = {}
 
-        # For logging the number of messages received
+        # For logging the number of messages received, next() on the count is
+        # atomic so message_counter stays correct across dispatch threads
         self.message_counter = 0
+        self._message_counter_iter = itertools.count(1)
+
+        # per message class results of the type checks in process_message
+        self._dispatch_cache: Dict[type, Tuple[bool, bool, Any]] = {}
 
     def post_init(self) -> None:
         debug(f"> Creating {self.pprint}")
 
+    @cached_property
+    def signing_key_hex(self) -> str:
+        # the keys are only set in __init__ so the hex forms can be kept
+        return self.signing_key.encode(encoder=HexEncoder).decode("utf-8")
+
+    @cached_property
+    def verify_key_hex(self) -> str:
+        return self.verify_key.encode(encoder=HexEncoder).decode("utf-8")
+
+    @cached_property
+    def store(self) -> ObjectStore:
+        return self._store_type(
+            settings=self.settings,
+            nosql_db_engine=self.nosql_db_engine,
+            db_name=self.db_name,
+        )
+
+    @cached_property
+    def setup(self) -> NoSQLSetupManager:
+        return NoSQLSetupManager(self.nosql_db_engine, self.db_name)
+
+    @cached_property
+    def nosql_db_engine(self) -> MongoClient:
+        # built on first use. pymongo is already loaded by the node managers,
+        # the local imports only defer loading pymongo_inmemory, which starts
+        # a mongod as soon as its client is built,
+        # connect=False only defers the socket of a pymongo client to a server
+        if self.settings and self.settings.MONGO_USERNAME:
+            # third party
+            from pymongo import MongoClient
+
+            # FIXME: Modify to use environment variable
+            return MongoClient(  # nosec
+                host=self.settings.MONGO_HOST,
+                port=self.settings.MONGO_PORT,
+                username=self.settings.MONGO_USERNAME,
+                password=self.settings.MONGO_PASSWORD,
+                uuidRepresentation="standard",
+                connect=False,
+            )
+        else:
+            # third party
+            from pymongo_inmemory import MongoClient
+
+            return MongoClient(port=27017, uuidRepresentation="standard", connect=False)
+
+    def ensure_document_store(self) -> None:
+        # creating the lock backend sets up its collection in mongo, so only do it
+        # right before the first lock is taken
+        if self.document_store and not self._document_store_configured:
+            configure(ShylockPymongoBackend.create(self.nosql_db_engine, self.db_name))
+            self._document_store_configured = True
+
     @property
     def icon(self) -> str:
         return "📍"
@@ -378,7 +504,7 @@ class Node(AbstractNode):
         return Metadata(
             name=node_setup.domain_name,
             id=self.id,
-            node_type=str(type(self).__name__),
+            node_type=self._node_type_name,
             version=str(__version__),
             description=node_setup.description,
             deployed_on=node_setup.deployed_on,
@@ -388,37 +514,27 @@ class Node(AbstractNode):
 
     def add_peer_routes(self, peer: NoSQLNode) -> None:
         try:
-            routes = peer.node_route
-            for route in routes:
-                self.add_route(
-                    node_id=UID.from_string(value=peer.node_uid),
-                    node_name=peer.node_name,
-                    host_or_ip=route.host_or_ip,
-                    is_vpn=route.is_vpn,
-                    private=route.private,
-                    port=route.port,
-                    protocol=route.protocol,
-                )
+            self._add_routes_batch(
+                node_id=UID.from_string(value=peer.node_uid),
+                node_name=peer.node_name,
+                routes=peer.node_route,
+            )
         except Exception as e:
             error(f"Failed to add route to peer {peer}. {e}")
 
     def reload_peer_clients(self) -> None:
-        peers = self.node.all()  # type: ignore
-        for peer in peers:
-            self.add_peer_routes(peer=peer)
-        debug("Finished loading all the peer clients", self.peer_route_clients)
+        # each peer is connected in its own worker, the routes of a peer are
+        # added to the node as a single batch
+        with ThreadPoolExecutor(max_workers=PEER_INIT_THREADS) as executor:
+            list(executor.map(self.add_peer_routes, self.node.all()))  # type: ignore
+        debug("Finished loading all the peer clients", self._peer_clients)
 
     def all_peer_clients(self) -> Dict[UID, List[Client]]:
-        # get all the routes for each client and sort by VPN first
-        all_clients = {}
-        for node_id in self.peer_route_clients.keys():
-            all_clients[node_id] = (
-                list(self.peer_route_clients[node_id]["vpn"].values())
-                + list(self.peer_route_clients[node_id]["https"].values())
-                + list(self.peer_route_clients[node_id]["http"].values())
-            )
-
-        return all_clients
+        # the routes for each client are already sorted with VPN first
+        return {
+            node_id: [client for _, _, client in clients]
+            for node_id, clients in self._peer_clients.items()
+        }
 
     def add_route(
         self,
@@ -430,70 +546,102 @@ class Node(AbstractNode):
         port: int,
         protocol: str,
     ) -> None:
-        # relative
-        from ....grid.client.client import connect
-
-        debug(
-            f"Adding route {node_id}, {node_name}, "
-            + f"{protocol}://{host_or_ip}:{port}, vpn: {is_vpn}, private: {private}"
+        route = NoSQLNodeRoute(
+            host_or_ip=host_or_ip,
+            is_vpn=is_vpn,
+            private=private,
+            port=port,
+            protocol=protocol,
         )
-        try:
-            grid_url = GridURL.from_url(
-                f"{protocol}://{host_or_ip}:{port}"
-            ).as_container_host(container_host=self.settings.CONTAINER_HOST)
-            security_key = "vpn" if is_vpn else protocol
-            # make sure the node_id is in the Dict
-            node_id_dict: Dict[str, Dict[str, Client]] = {
-                "vpn": {},
-                "http": {},
-                "https": {},
-            }
-            if node_id in self.peer_route_clients:
-                node_id_dict = self.peer_route_clients[node_id]
-
-            if grid_url.base_url not in node_id_dict[security_key]:
-                # connect and save the client
-                client = connect(url=grid_url.with_path("/api/v1"), timeout=0.3)
-                node_id_dict[security_key][grid_url.base_url] = client
+        self._add_routes_batch(node_id=node_id, node_name=node_name, routes=[route])
 
-            self.peer_route_clients[node_id] = node_id_dict
-        except Exception as e:
+    def _add_routes_batch(
+        self, node_id: UID, node_name: str, routes: List[NoSQLNodeRoute]
+    ) -> None:
+        # work out every url first and skip the ones we already have a client for
+        with self._peer_clients_lock:
+            known = {
+                (priority, base_url)
+                for priority, base_url, _ in self._peer_clients.get(node_id, ())
+            }
+        pending: Dict[Tuple[int, str], Tuple[NoSQLNodeRoute, GridURL]] = {}
+        for route in routes:
+            try:
+                grid_url = self._build_grid_url(
+                    protocol=route.protocol,
+                    host_or_ip=route.host_or_ip,
+                    port=route.port,
+                )
+                security_key = "vpn" if route.is_vpn else route.protocol
+                key = (SECURITY_PRIORITY[security_key], grid_url.base_url)
+            except Exception as e:
+                # a malformed route or unknown protocol only skips that route,
+                # the peer's other routes are still added
+                debug(
+                    f"Skipping route {node_id}, {node_name}, {route.protocol}://"
+                    + f"{route.host_or_ip}:{route.port}. {e}"
+                )
+                continue
+            if key not in known:
+                pending.setdefault(key, (route, grid_url))
+
+        # the connects happen outside of the lock so that several peers can
+        # handshake at the same time
+        connected: List[Tuple[int, str, Client]] = []
+        for key, (route, grid_url) in pending.items():
             debug(
-                f"Adding route {node_id}, {node_name}, "
-                + f"{protocol}://{host_or_ip}:{port}, vpn: {is_vpn}, "
-                + f"private: {private}. {e}"
+                f"Adding route {node_id}, {node_name}, {grid_url.base_url}, "
+                + f"vpn: {route.is_vpn}, private: {route.private}"
             )
+            try:
+                connected.append((*key, self._do_connect(grid_url)))
+            except Exception as e:
+                debug(
+                    f"Adding route {node_id}, {node_name}, {grid_url.base_url}, "
+                    + f"vpn: {route.is_vpn}, private: {route.private}. {e}"
+                )
+
+        if not connected:
+            return
+
+        with self._peer_clients_lock:
+            clients = self._peer_clients[node_id]
+            known = {(priority, base_url) for priority, base_url, _ in clients}
+            clients.extend(c for c in connected if (c[0], c[1]) not in known)
+            clients.sort(key=itemgetter(0))
+
+    @staticmethod
+    def _build_peer_url(protocol: str, host_or_ip: str, port: int) -> str:
+        return f"{protocol}://{host_or_ip}:{port}"
+
+    def _build_grid_url(self, protocol: str, host_or_ip: str, port: int) -> GridURL:
+        return GridURL.from_url(
+            self._build_peer_url(protocol, host_or_ip, port)
+        ).as_container_host(container_host=self._container_host)
+
+    def _do_connect(self, grid_url: GridURL) -> Client:
+        # relative
+        from ....grid.client.client import connect
+
+        return connect(url=grid_url.with_path("/api/v1"), timeout=0.3)
 
     def get_peer_client(self, node_id: UID, only_vpn: bool = True) -> Optional[Client]:
         # if we don't have it see if we can get it from the db first
-        if node_id not in self.peer_route_clients:
+        if node_id not in self._peer_clients:
             peer = self.node.first(node_uid=node_id.no_dash)  # type: ignore
             self.add_peer_routes(peer=peer)
 
-        try:
-            if node_id in self.peer_route_clients.keys():
-                routes = self.peer_route_clients[node_id]
-                # if we want VPN only then check there are some
-                if only_vpn and "vpn" in routes and len(routes["vpn"]) == 0:
-                    # we want VPN only but there are none
-                    return None
-                elif "vpn" in routes and len(routes["vpn"]) > 0:
-                    # if we have VPN lets use it
-                    return list(routes["vpn"].values())[0]
-                elif "https" in routes and len(routes["https"]) > 0:
-                    # we only have https
-                    return list(routes["https"].values())[0]
-                elif "http" in routes and len(routes["http"]) > 0:
-                    # we only have http and don't care
-                    return list(routes["http"].values())[0]
-        except Exception as e:
-            error(
-                f"Exception while selecting node_id {node_id} from peer_route_clients. "
-                f"{self.peer_route_clients}. {e}"
-            )
+        clients = self._peer_clients.get(node_id)
+        if not clients:
+            # there are no routes for this ID
+            return None
 
-        # there are no routes for this ID
-        return None
+        # the best route comes first, VPN if we have one
+        priority, _, client = clients[0]
+        if only_vpn and priority != SECURITY_PRIORITY["vpn"]:
+            # we want VPN only but there are none
+            return None
+        return client
 
     @property
     def id(self) -> UID:
@@ -503,23 +651,26 @@ class Node(AbstractNode):
         # this needs to be defensive by checking domain_id NOT domain.id or it breaks
         try:
             msg_address_id = msg.address
-            return msg_address_id == self.id
         except Exception as excp3:
             critical(
                 f"Error checking if {msg.pprint} is for me on {self.pprint}. {excp3}"
             )
-        return False
+            return False
+        return msg_address_id == self._id_cached
 
     def recv_immediate_msg_with_reply(
         self, msg: SignedImmediateSyftMessageWithReply
     ) -> SignedImmediateSyftMessageWithoutReply:
-        contents = getattr(msg, "message", msg)
+        contents = msg.message if isinstance(msg, SignedMessage) else msg
         # exceptions can be easily triggered which break any loops
         # so we need to catch them here and respond with a special exception
         # message reply
         try:
             debug(
-                f"> Received with Reply {contents.pprint} {contents.id} @ {self.pprint}"
+                "> Received with Reply {} {} @ {}",
+                lambda: contents.pprint,
+                lambda: contents.id,
+                lambda: self.pprint,
             )
 
             response = self.process_message(
@@ -533,15 +684,7 @@ class Node(AbstractNode):
             if isinstance(e, AuthorizationException):
                 private_log_msg = "An AuthorizationException has been triggered"
                 public_exception = e
-            elif isinstance(
-                e,
-                (
-                    OblvKeyNotFoundError,
-                    OblvProxyConnectPCRError,
-                    OblvEnclaveUnAuthorizedError,
-                    OblvEnclaveError,
-                ),
-            ):
+            elif isinstance(e, _OBLV_EXCEPTIONS):
                 private_log_msg = "An OblvException has been triggered"
                 public_exception = e
             else:
@@ -574,10 +717,13 @@ class Node(AbstractNode):
     def recv_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
     ) -> None:
-        contents = getattr(msg, "message", msg)
+        contents = msg.message if isinstance(msg, SignedMessage) else msg
         if contents:
             debug(
-                f"> Received without Reply {contents.pprint} {contents.id} @ {self.pprint}"
+                "> Received without Reply {} {} @ {}",
+                lambda: contents.pprint,
+                lambda: contents.id,
+                lambda: self.pprint,
             )
 
         self.process_message(msg=msg, router=self.immediate_msg_without_reply_router)
@@ -632,24 +778,47 @@ class Node(AbstractNode):
     def process_message(
         self, msg: SignedMessage, router: dict
     ) -> Union[SyftMessage, None]:
-        self.message_counter += 1
+        self.message_counter = next(self._message_counter_iter)
         try:
-            contents = getattr(
-                msg, "message", msg
-            )  # in the event the message is unsigned
-            debug(f"> Processing 📨 {msg.pprint} @ {self.pprint} {contents}")
+            msg_cls = msg.__class__
+            try:
+                (
+                    is_signed,
+                    is_allowed_unsigned,
+                    forwarding_service,
+                ) = self._dispatch_cache[msg_cls]
+            except KeyError:
+                (
+                    is_signed,
+                    is_allowed_unsigned,
+                    forwarding_service,
+                ) = self._build_dispatch(msg_cls)
+
+            # in the event the message is unsigned it is its own contents
+            contents = msg.message if is_signed else msg
+            debug(
+                "> Processing 📨 {} @ {} {}",
+                lambda: msg.pprint,
+                lambda: self.pprint,
+                lambda: contents,
+            )
             if self.message_is_for_me(msg=msg):
-                debug(f"> Recipient Found {msg.pprint}{msg.address} == {self.pprint}")
+                debug(
+                    "> Recipient Found {}{} == {}",
+                    lambda: msg.pprint,
+                    lambda: msg.address,
+                    lambda: self.pprint,
+                )
 
                 # only a small number of messages are allowed to be unsigned otherwise
                 # they need to be valid
-                if type(msg) not in self.allowed_unsigned_messages and not msg.is_valid:  # type: ignore
+                if not is_allowed_unsigned and not msg.is_valid:  # type: ignore
                     error(f"Message is not valid. {msg}")
                     traceback_and_raise(Exception("Message is not valid."))
 
                 # Process Message here
                 try:  # we use try/except here because it's marginally faster in Python
-                    service = router[type(contents)]
+                    service = self._resolve_router(router, contents.__class__)
                 except KeyError as e:
                     log = (
                         f"The node {self.id} of type {type(self)} cannot process messages of type "
@@ -660,7 +829,7 @@ class Node(AbstractNode):
                     self.ensure_services_have_been_registered_error_if_not()
                     traceback_and_raise(KeyError(log))
 
-                if type(msg) in self.allowed_unsigned_messages:  # type: ignore
+                if is_allowed_unsigned:
                     result = service.process(node=self, msg=contents, verify_key=None)
                 else:
                     result = service.process(
@@ -672,16 +841,14 @@ class Node(AbstractNode):
 
             else:
                 debug(
-                    f"> Recipient Not Found ↪️ {msg.pprint}{msg.address} != {self.pprint}"
+                    "> Recipient Not Found ↪️ {}{} != {}",
+                    lambda: msg.pprint,
+                    lambda: msg.address,
+                    lambda: self.pprint,
                 )
                 # Forward message onwards
-                if issubclass(type(msg), SignedImmediateSyftMessageWithReply):
-                    return self.signed_message_with_reply_forwarding_service.process(
-                        node=self,
-                        msg=msg,  # type: ignore
-                    )
-                if issubclass(type(msg), SignedImmediateSyftMessageWithoutReply):
-                    return self.signed_message_without_reply_forwarding_service.process(
+                if forwarding_service is not None:
+                    return forwarding_service.process(
                         node=self,
                         msg=msg,  # type: ignore
                     )
@@ -690,6 +857,24 @@ class Node(AbstractNode):
             raise e
         return None
 
+    def _build_dispatch(self, msg_cls: type) -> Tuple[bool, bool, Any]:
+        """Work out the per class part of process_message once: whether the message
+        is signed, whether it may skip signature validation and which forwarding
+        service handles it when it is not addressed to this node."""
+        forwarding_service: Any = None
+        if issubclass(msg_cls, SignedImmediateSyftMessageWithReply):
+            forwarding_service = self.signed_message_with_reply_forwarding_service
+        elif issubclass(msg_cls, SignedImmediateSyftMessageWithoutReply):
+            forwarding_service = self.signed_message_without_reply_forwarding_service
+
+        dispatch = (
+            issubclass(msg_cls, SignedMessage),
+            msg_cls in self.allowed_unsigned_messages,
+            forwarding_service,
+        )
+        self._dispatch_cache[msg_cls] = dispatch
+        return dispatch
+
     def ensure_services_have_been_registered_error_if_not(self) -> None:
         if not self.services_registered:
             traceback_and_raise(
@@ -713,37 +898,40 @@ class Node(AbstractNode):
             # to one or more message types.
             isr_instance = isr()
             for handler_type in isr.message_handler_types():
-                # for each explicitly supported type, add it to the router
+                # for each explicitly supported type, add it to the router, the
+                # sub-classes are resolved on first use by _resolve_router
                 self.immediate_msg_with_reply_router[handler_type] = isr_instance
 
-                # for all sub-classes of the explicitly supported type, add them
-                # to the router as well.
-                for handler_type_subclass in get_subclasses(obj_type=handler_type):
-                    self.immediate_msg_with_reply_router[
-                        handler_type_subclass
-                    ] = isr_instance
-
         for iswr in self.immediate_services_without_reply:
             # Create a single instance of the service to cache in the router corresponding
             # to one or more message types.
             iswr_instance = iswr()
             for handler_type in iswr.message_handler_types():
-                # for each explicitly supported type, add it to the router
+                # for each explicitly supported type, add it to the router, the
+                # sub-classes are resolved on first use by _resolve_router
                 self.immediate_msg_without_reply_router[handler_type] = iswr_instance
 
-                # for all sub-classes of the explicitly supported type, add them
-                # to the router as well.
-                for handler_type_subclass in get_subclasses(obj_type=handler_type):
-                    self.immediate_msg_without_reply_router[
-                        handler_type_subclass
-                    ] = iswr_instance
-
         # Set the services_registered flag to true so that we know that all services
         # have been properly registered. This mostly exists because someone might
         # accidentally delete (forget to call) this method inside the __init__ function
         # of a sub-class of Node.
         self.services_registered = True
 
+    @staticmethod
+    def _resolve_router(router: dict, msg_type: type) -> Any:
+        """Find the service for msg_type, falling back to the closest registered
+        base class in its MRO. The result is memoized in the router so that every
+        later lookup for msg_type is a single dict access. Raises a KeyError if no
+        service handles msg_type or any of its base classes."""
+        try:
+            return router[msg_type]
+        except KeyError:
+            for base in msg_type.__mro__[1:]:
+                if base in router:
+                    service = router[msg_type] = router[base]
+                    return service
+            raise
+
     def __repr__(self) -> str:
         no_dash = str(self.id).replace("-", "")
         return f"{self.node_type}: {self.name}: {no_dash}"
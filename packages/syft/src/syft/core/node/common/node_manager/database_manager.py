@@ -151,4 +151,7 @@ class NoSQLDatabaseManager:
         self.drop()
 
     def contain(self, **search_params: Any) -> bool:
-        return bool(self.query(**search_params))
+        # only ask for the _id of the first match instead of loading every match
+        search_params = convert_to_mongo_id(search_params)
+        d = self._collection.find_one(search_params, projection={"_id": 1})
+        return d is not None
@@ -201,6 +201,11 @@ class NoSQLUserManager(NoSQLDatabaseManager):
             website=website,
         )
 
+    def has_any_owner(self) -> bool:
+        # create_admin only adds the owner to an empty collection and every
+        # other user is created after setup, so any user means an owner exists
+        return self.contain()
+
     def is_owner(self, verify_key: VerifyKey) -> bool:
         user = self.get_user(verify_key)
         return user.role["name"] == "Owner"
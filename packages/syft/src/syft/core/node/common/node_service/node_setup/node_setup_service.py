@@ -54,11 +54,11 @@ def create_initial_setup(
     msg: CreateInitialSetUpMessage, node: DomainInterface, verify_key: VerifyKey
 ) -> SuccessResponseMessage:
     # use a lock in mongodb to ensure we run this on each backend container in sequence
-
+    node.ensure_document_store()
     with Lock("create_initial_setup"):
         # 1 - Should not run if Node has an owner
 
-        if len(node.users) and len(node.setup):
+        if node.users.has_any_owner() and node.setup.contain():
             set_node_uid(node=node)  # make sure the node always has the same UID
             raise OwnerAlreadyExistsError
 
@@ -74,8 +74,11 @@ def create_initial_setup(
 
         signing_key = msg.signing_key
 
-        # convert to hex
-        _node_private_key = signing_key.encode(encoder=HexEncoder).decode("utf-8")  # type: ignore
+        # convert to hex, the node usually sets itself up with its own key
+        if signing_key == node.signing_key:
+            _node_private_key = node.signing_key_hex
+        else:
+            _node_private_key = signing_key.encode(encoder=HexEncoder).decode("utf-8")  # type: ignore
         _admin_role = node.roles.owner_role
 
         create_setup = False
@@ -98,7 +101,7 @@ def create_initial_setup(
             # 4 - Create Admin User
             # use a lock in mongodb to ensure we only create one of these
             with Lock(f"syft_users_{msg.email}"):
-                if len(node.users) == 0:
+                if not node.users.has_any_owner():
                     node.users.create_admin(
                         name=msg.name,
                         email=msg.email,
@@ -114,7 +117,7 @@ def create_initial_setup(
         if create_user and create_setup:
             print("CreateInitialSetUpMessage Successful!")
         else:
-            if len(node.users) == 0:
+            if not node.users.has_any_owner():
                 print(
                     f"Failed CreateInitialSetUpMessage User: {create_user} Setup: {create_setup}"
                 )
@@ -139,7 +142,8 @@ def get_setup(
     del _setup["signing_key"]
 
     if node.network:
-        _setup["domains"] = len(node.node.all())
+        # count_documents on the server, no need to load every node row
+        _setup["domains"] = len(node.node)
     return GetSetUpResponse(
         address=msg.reply_to,
         content=_setup,
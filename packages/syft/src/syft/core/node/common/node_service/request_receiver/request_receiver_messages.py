@@ -128,7 +128,7 @@ class RequestMessage(ImmediateSyftMessageWithoutReply):
             try:
                 node = self.destination_node_if_available
                 router = node.immediate_msg_without_reply_router
-                service = router[type(msg)]
+                service = node._resolve_router(router, type(msg))
                 service.process(
                     node=self.destination_node_if_available,
                     msg=msg,
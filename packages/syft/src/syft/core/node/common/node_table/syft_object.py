@@ -112,6 +112,9 @@ class SyftObjectRegistry:
 
 print_type_cache = defaultdict(list)
 
+# (class, attr list name) -> key types, these never change for a class
+_keys_types_cache: Dict[Tuple[type, str], Dict[str, type]] = {}
+
 
 class SyftObject(SyftBaseObject, SyftObjectRegistry):
     __canonical_name__ = "SyftObject"
@@ -306,6 +309,16 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
 
     @classmethod
     def _syft_keys_types_dict(cls, attr_name: str) -> Dict[str, type]:
+        # worked out once per class, callers must not mutate the result
+        cache_key = (cls, attr_name)
+        kt_dict = _keys_types_cache.get(cache_key, None)
+        if kt_dict is None:
+            kt_dict = cls._syft_build_keys_types_dict(attr_name)
+            _keys_types_cache[cache_key] = kt_dict
+        return kt_dict
+
+    @classmethod
+    def _syft_build_keys_types_dict(cls, attr_name: str) -> Dict[str, type]:
         kt_dict = {}
         for key in getattr(cls, attr_name, []):
             type_ = cls.__fields__[key].type_
@@ -318,7 +318,9 @@ class Domain(Node):
                 delete_obj=False,
             )
 
-            service = self.immediate_msg_with_reply_router[type(obj_msg)]
+            service = self._resolve_router(
+                self.immediate_msg_with_reply_router, type(obj_msg)
+            )
             response = service.process(
                 node=self, msg=obj_msg, verify_key=self.root_verify_key
             )
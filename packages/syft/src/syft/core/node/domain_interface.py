@@ -1,3 +1,6 @@
+# stdlib
+from typing import Callable
+
 # third party
 from pydantic import BaseSettings
 
@@ -23,3 +26,4 @@ class DomainInterface(NodeServiceInterface):
     settings: BaseSettings
     tasks: NoSQLTaskManager
     oblv_keys: NoSQLOblvKeyManager
+    ensure_document_store: Callable[[], None]
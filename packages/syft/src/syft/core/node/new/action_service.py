@@ -80,6 +80,37 @@ class ActionService(AbstractService):
             return Ok(action_object)
         return result.err()
 
+    @service_method(path="action.set_many", name="set_many")
+    def set_many(
+        self,
+        context: AuthedServiceContext,
+        action_objects: List[Union[ActionObject, TwinObject]],
+    ) -> Result[List[ActionObject], str]:
+        """Save several objects to the action store in one call, if one fails
+        the objects created by the call are removed again"""
+        pointers = []
+        created: List[UID] = []
+        for action_object in action_objects:
+            is_new = not self.store.exists(uid=action_object.id)
+            result = self.store.set(
+                uid=action_object.id,
+                credentials=context.credentials,
+                syft_object=action_object,
+            )
+            if result.is_err():
+                # the caller never learns the ids of the objects stored so far,
+                # so remove the ones this call created rather than orphan them
+                for uid in created:
+                    self.store.delete(uid=uid, credentials=context.credentials)
+                return result.err()
+            if is_new:
+                created.append(action_object.id)
+            if isinstance(action_object, TwinObject):
+                action_object = action_object.mock
+            action_object.syft_point_to(context.node.id)
+            pointers.append(action_object)
+        return Ok(pointers)
+
     @service_method(path="action.save", name="save")
     def save(
         self,
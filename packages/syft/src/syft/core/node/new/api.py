@@ -59,6 +59,10 @@ class APIRegistry:
         return cls.__api_registry__[node_uid]
 
 
+# calls after which the API served by the node can change
+_API_CHANGING_PATHS = frozenset({"code.submit", "request.apply", "request.revert"})
+
+
 @serializable(recursive_serde=True)
 class APIEndpoint(SyftBaseObject):
     path: str
@@ -316,6 +320,13 @@ class SyftAPI(SyftObject):
         signed_call = api_call.sign(credentials=self.signing_key)
         result = self.connection.make_call(signed_call)
 
+        if api_call.path in _API_CHANGING_PATHS:
+            # relative
+            from .client import clear_connection_cache
+
+            # submitted or approved code adds endpoints to the node's API
+            clear_connection_cache(prefix=self.connection.get_cache_key())
+
         if isinstance(result, OkErr):
             if result.is_ok():
                 return result.ok()
@@ -2,9 +2,14 @@
 from enum import Enum
 import hashlib
 import json
+import time
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 from typing import cast
 
@@ -18,6 +23,13 @@ from result import OkErr
 from tqdm import tqdm
 from typing_extensions import Self
 
+try:
+    # third party
+    from orjson import loads as json_loads
+except ImportError:
+    # json.loads accepts bytes as well, orjson is just faster at it
+    json_loads = json.loads
+
 # relative
 from .... import __version__
 from ....core.node.common.node_table.syft_object import SYFT_OBJECT_VERSION_1
@@ -43,6 +55,8 @@ from .dataset import CreateDataset
 from .node import NewNode
 from .response import SyftError
 from .response import SyftSuccess
+from .response import TAGGED_RESPONSE_MEDIA_TYPE
+from .response import decode_tagged_response
 from .user_service import UserService
 
 # use to enable mitm proxy
@@ -65,16 +79,77 @@ def upgrade_tls(url: GridURL, response: Response) -> GridURL:
 API_PATH = "/api/v1/new"
 
 
+# plain strings for the request paths, these skip the Enum member lookup
+_ROUTE_METADATA = f"{API_PATH}/metadata"
+_ROUTE_API = f"{API_PATH}/api"
+_ROUTE_LOGIN = f"{API_PATH}/login"
+_ROUTE_API_CALL = f"{API_PATH}/api_call"
+
+
 class Routes(Enum):
-    ROUTE_METADATA = f"{API_PATH}/metadata"
-    ROUTE_API = f"{API_PATH}/api"
-    ROUTE_LOGIN = f"{API_PATH}/login"
-    ROUTE_API_CALL = f"{API_PATH}/api_call"
+    ROUTE_METADATA = _ROUTE_METADATA
+    ROUTE_API = _ROUTE_API
+    ROUTE_LOGIN = _ROUTE_LOGIN
+    ROUTE_API_CALL = _ROUTE_API_CALL
 
 
 DEFAULT_PYGRID_PORT = 80
 DEFAULT_PYGRID_ADDRESS = f"http://localhost:{DEFAULT_PYGRID_PORT}"
 
+# upload_dataset sends assets in batches of at most this many assets or, once
+# a batch holds at least one asset, this many bytes of asset data
+ASSET_UPLOAD_BATCH_SIZE = 16
+ASSET_UPLOAD_BATCH_NBYTES = 64 * 1024 * 1024
+
+
+def _asset_nbytes(asset: Any) -> int:
+    # a rough size for batching, objects without nbytes count as empty
+    return getattr(asset.data, "nbytes", 0) + getattr(asset.mock, "nbytes", 0)
+
+
+def _asset_batches(assets: List[Any]) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    batch_nbytes = 0
+    for asset in assets:
+        nbytes = _asset_nbytes(asset)
+        if batch and (
+            len(batch) >= ASSET_UPLOAD_BATCH_SIZE
+            or batch_nbytes + nbytes > ASSET_UPLOAD_BATCH_NBYTES
+        ):
+            yield batch
+            batch, batch_nbytes = [], 0
+        batch.append(asset)
+        batch_nbytes += nbytes
+    if batch:
+        yield batch
+
+
+# seconds for which the metadata and API fetched from a node are reused
+CONNECTION_CACHE_TTL = 60
+
+_METADATA_CACHE: Dict[str, Tuple[float, NodeMetadataJSON]] = {}
+# the API is kept serialized so every caller gets its own SyftAPI to bind
+_API_CACHE: Dict[str, Tuple[float, bytes]] = {}
+
+
+def _get_cached(cache: Dict[str, Tuple[float, Any]], key: str) -> Optional[Any]:
+    entry = cache.get(key, None)
+    if entry is None:
+        return None
+    created_at, value = entry
+    if time.monotonic() - created_at > CONNECTION_CACHE_TTL:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def clear_connection_cache(prefix: str = "") -> None:
+    """Drop the cached metadata and APIs of every connection whose cache key
+    starts with prefix, or of all connections when no prefix is given."""
+    for cache in (_METADATA_CACHE, _API_CACHE):
+        for key in [key for key in cache if key.startswith(prefix)]:
+            cache.pop(key, None)
+
 
 @serializable(recursive_serde=True)
 class HTTPConnection(NodeConnection):
@@ -100,16 +175,32 @@ class HTTPConnection(NodeConnection):
     def get_cache_key(self) -> str:
         return str(self.url)
 
+    def _get_credentials_cache_key(self, credentials: SyftSigningKey) -> str:
+        # keyed on the public half so no private keys are kept in the cache
+        verify_key = credentials.verify if credentials is not None else ""
+        return f"{self.get_cache_key()}|{self.proxy_target_uid}|{verify_key}"
+
     @property
     def api_url(self) -> GridURL:
-        return self.url.with_path(self.routes.ROUTE_API_CALL.value)
+        return self.url.with_path(_ROUTE_API_CALL)
 
     @property
     def session(self) -> Session:
         if self._session is None:
             session = requests.Session()
-            retry = Retry(total=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
+            # read errors and 502 / 503 responses are only retried for GETs,
+            # a POST may already have run on the node and API calls are not
+            # idempotent. urllib3 retries connect errors for every method, the
+            # request never left the client so those are safe
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503],
+                allowed_methods=frozenset(["GET"]),
+            )
+            adapter = HTTPAdapter(
+                pool_connections=10, pool_maxsize=32, max_retries=retry
+            )
             session.mount("http://", adapter)
             session.mount("https://", adapter)
             self._session = session
@@ -130,11 +221,14 @@ class HTTPConnection(NodeConnection):
 
         return response.content
 
+    def _session_post(self, url: GridURL, **kwargs: Any) -> Response:
+        return self.session.post(
+            str(url), verify=verify_tls(), proxies=HTTPConnection.proxies, **kwargs
+        )
+
     def _make_post(self, path: str, json: Dict[str, Any]) -> bytes:
         url = self.url.with_path(path)
-        response = self.session.post(
-            str(url), verify=verify_tls(), json=json, proxies=HTTPConnection.proxies
-        )
+        response = self._session_post(url, json=json)
         if response.status_code != 200:
             raise requests.ConnectionError(
                 f"Failed to fetch {url}. Response returned with code {response.status_code}"
@@ -146,6 +240,11 @@ class HTTPConnection(NodeConnection):
         return response.content
 
     def get_node_metadata(self, credentials: SyftSigningKey) -> NodeMetadataJSON:
+        cache_key = self._get_credentials_cache_key(credentials)
+        metadata = _get_cached(_METADATA_CACHE, cache_key)
+        if metadata is not None:
+            return metadata
+
         if self.proxy_target_uid:
             call = SyftAPICall(
                 node_uid=self.proxy_target_uid,
@@ -158,14 +257,21 @@ class HTTPConnection(NodeConnection):
             response = self.make_call(signed_call)
             if isinstance(response, SyftError):
                 return response
-            return response.to(NodeMetadataJSON)
+            metadata = response.to(NodeMetadataJSON)
         else:
-            response = self._make_get(self.routes.ROUTE_METADATA.value)
-            metadata_json = json.loads(response)
-            return NodeMetadataJSON(**metadata_json)
+            response = self._make_get(_ROUTE_METADATA)
+            metadata_json = json_loads(response)
+            metadata = NodeMetadataJSON(**metadata_json)
+
+        _METADATA_CACHE[cache_key] = (time.monotonic(), metadata)
+        return metadata
 
     def get_api(self, credentials: SyftSigningKey) -> SyftAPI:
-        content = self._make_get(self.routes.ROUTE_API.value)
+        cache_key = self._get_credentials_cache_key(credentials)
+        content = _get_cached(_API_CACHE, cache_key)
+        if content is None:
+            content = self._make_get(_ROUTE_API)
+            _API_CACHE[cache_key] = (time.monotonic(), content)
         obj = _deserialize(content, from_bytes=True)
         obj.connection = self
         obj.signing_key = credentials
@@ -174,8 +280,10 @@ class HTTPConnection(NodeConnection):
         return cast(SyftAPI, obj)
 
     def connect(self, email: str, password: str) -> SyftSigningKey:
+        # logging in can change what the node serves us
+        clear_connection_cache(prefix=self.get_cache_key())
         credentials = {"email": email, "password": password}
-        response = self._make_post(self.routes.ROUTE_LOGIN.value, credentials)
+        response = self._make_post(_ROUTE_LOGIN, credentials)
         obj = _deserialize(response, from_bytes=True)
         if isinstance(obj, UserPrivateKey):
             return obj.signing_key
@@ -183,17 +291,31 @@ class HTTPConnection(NodeConnection):
 
     def make_call(self, signed_call: SignedSyftAPICall) -> Union[Any, SyftError]:
         msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
-        response = requests.post(
-            url=str(self.api_url),
+        response = self._session_post(
+            self.api_url,
             data=msg_bytes,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Accept": TAGGED_RESPONSE_MEDIA_TYPE,
+            },
+            stream=True,
         )
 
         if response.status_code != 200:
+            response.close()
             raise requests.ConnectionError(
                 f"Failed to fetch metadata. Response returned with code {response.status_code}"
             )
 
-        result = _deserialize(response.content, from_bytes=True)
+        # capnp needs the whole message in one buffer, so read the body in a
+        # single piece rather than letting response.content join 10KB chunks
+        content = response.raw.read(decode_content=True)
+        response.raw.release_conn()
+        # nodes that predate tagged responses ignore the Accept header
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith(TAGGED_RESPONSE_MEDIA_TYPE):
+            return decode_tagged_response(content)
+        result = _deserialize(content, from_bytes=True)
         return result
 
     def __repr__(self) -> str:
@@ -276,9 +398,11 @@ class PythonConnection(NodeConnection):
 @serializable(recursive_serde=True)
 class SyftClient:
     connection: NodeConnection
-    metadata: Optional[NodeMetadataJSON]
     credentials: Optional[SyftSigningKey]
 
+    # the cached id and hash are process local so they are not serialized
+    __attr_allowlist__ = ["connection", "metadata", "credentials", "_api"]
+
     def __init__(
         self,
         connection: NodeConnection,
@@ -287,15 +411,22 @@ class SyftClient:
         api: Optional[SyftAPI] = None,
     ) -> None:
         self.connection = connection
-        self.metadata = metadata
         self.credentials: Optional[SyftSigningKey] = credentials
+        self.metadata = metadata
         self._api = api
+        self._id: Optional[UID] = None
+        self._hash: Optional[int] = None
 
-        self.post_init()
-
-    def post_init(self) -> None:
-        if self.metadata is None:
+    @property
+    def metadata(self) -> Optional[NodeMetadataJSON]:
+        # fetched on first use instead of when the client is created
+        if self._metadata is None:
             self._fetch_node_metadata(self.credentials)
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Optional[NodeMetadataJSON]) -> None:
+        self._metadata = metadata
 
     @staticmethod
     def from_url(url: Union[str, GridURL]) -> Self:
@@ -311,7 +442,11 @@ class SyftClient:
 
     @property
     def id(self) -> Optional[UID]:
-        return UID.from_string(self.metadata.id) if self.metadata else None
+        if self.metadata is None:
+            return None
+        if getattr(self, "_id", None) is None:
+            self._id = UID.from_string(self.metadata.id)
+        return self._id
 
     @property
     def icon(self) -> str:
@@ -324,26 +459,48 @@ class SyftClient:
 
         return self._api
 
-    def upload_dataset(self, dataset: CreateDataset) -> Union[SyftSuccess, SyftError]:
+    def upload_dataset(
+        self, dataset: Union[CreateDataset, Iterable[CreateDataset]]
+    ) -> Union[SyftSuccess, SyftError]:
         # relative
         from .twin_object import TwinObject
 
-        for asset in tqdm(dataset.asset_list):
-            print(f"Uploading: {asset.name}")
-            twin = TwinObject(private_obj=asset.data, mock_obj=asset.mock)
-            response = self.api.services.action.set(twin)
-            if isinstance(response, SyftError):
-                print(f"Failed to upload asset\n: {asset}")
-                return response
-            asset.action_id = twin.id
-            asset.node_uid = self.id
-        valid = dataset.check()
-        if valid.ok():
-            return self.api.services.dataset.add(dataset=dataset)
-        else:
-            if len(valid.err()) > 0:
-                return tuple(valid.err())
-            return valid.err()
+        datasets = [dataset] if isinstance(dataset, CreateDataset) else list(dataset)
+        assets = [asset for dataset in datasets for asset in dataset.asset_list]
+
+        # a few assets per call instead of one round trip per asset, batches are
+        # bounded so no single request has to hold every asset's data
+        with tqdm(total=len(assets)) as progress:
+            for batch in _asset_batches(assets):
+                twins = [
+                    TwinObject(private_obj=asset.data, mock_obj=asset.mock)
+                    for asset in batch
+                ]
+                print(f"Uploading: {[asset.name for asset in batch]}")
+                response = self.api.services.action.set_many(twins)
+                # errors from action services come back as plain strings
+                if isinstance(response, str):
+                    response = SyftError(message=response)
+                if isinstance(response, SyftError):
+                    # assets from earlier batches are stored and keep their
+                    # action_id, none from this batch were kept
+                    print(f"Failed to upload assets\n: {batch}")
+                    return response
+                for asset, twin in zip(batch, twins):
+                    asset.action_id = twin.id
+                    asset.node_uid = self.id
+                progress.update(len(batch))
+
+        for dataset in datasets:
+            valid = dataset.check()
+            if not valid.ok():
+                if len(valid.err()) > 0:
+                    return tuple(valid.err())
+                return valid.err()
+
+        if len(datasets) == 1:
+            return self.api.services.dataset.add(dataset=datasets[0])
+        return self.api.services.dataset.add_many(datasets=datasets)
 
     def exchange_route(self, client: Self) -> None:
         result = self.api.services.network.exchange_credentials_with(client=client)
@@ -401,7 +558,10 @@ class SyftClient:
         return client
 
     def __hash__(self) -> int:
-        return hash(self.id) + hash(self.connection)
+        if getattr(self, "_hash", None) is None:
+            node_id = self.metadata.id if self.metadata else None
+            self._hash = hash((node_id, self.connection.get_cache_key()))
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, SyftClient):
@@ -429,6 +589,9 @@ class SyftClient:
         if isinstance(metadata, NodeMetadataJSON):
             metadata.check_version(__version__)
             self.metadata = metadata
+            # both are derived from the metadata
+            self._id = None
+            self._hash = None
         print(metadata)
 
     def _fetch_api(self, credentials: SyftSigningKey):
@@ -483,14 +646,20 @@ def login(
 
 class SyftClientSessionCache:
     __credentials_store__: Dict = {}
-    __cache_key_format__ = "{email}-{password}-{connection}"
 
     @classmethod
-    def _get_key(cls, email: str, password: str, connection: str) -> str:
-        key = cls.__cache_key_format__.format(
-            email=email, password=password, connection=connection
-        )
-        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    def _get_key(cls, email: str, password: str, connection: str) -> bytes:
+        # the fields are hashed one by one with a separator that can't appear
+        # in them, rather than formatting them into one string first. The key
+        # is derived from the password so it stays a cryptographic hash, but
+        # blake2b is faster than sha256 and 16 bytes is plenty for a dict key
+        key = hashlib.blake2b(digest_size=16)
+        key.update(email.encode("utf-8"))
+        key.update(b"\0")
+        key.update(password.encode("utf-8"))
+        key.update(b"\0")
+        key.update(connection.encode("utf-8"))
+        return key.digest()
 
     @classmethod
     def add_client(
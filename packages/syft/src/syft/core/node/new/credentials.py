@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 # stdlib
+from functools import lru_cache
 from typing import Any
 from typing import Union
 
@@ -30,6 +31,7 @@ class SyftVerifyKey(SyftBaseModel):
         return self.verify_key.encode(encoder=HexEncoder).decode("utf-8")
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def from_string(key_str: str) -> SyftVerifyKey:
         return SyftVerifyKey(verify_key=VerifyKey(bytes.fromhex(key_str)))
 
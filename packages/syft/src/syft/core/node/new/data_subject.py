@@ -12,7 +12,7 @@ from ....core.node.common.node_table.syft_object import SyftObject
 from ...common.serde.serializable import serializable
 from .document_store import PartitionKey
 
-NamePartitionKey = PartitionKey(key="name", type_=str)
+NamePartitionKey = PartitionKey.intern(key="name", type_=str)
 
 
 @serializable(recursive_serde=True)
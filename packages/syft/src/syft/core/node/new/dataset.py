@@ -38,7 +38,7 @@ class TupleDict(OrderedDict):
         return super(TupleDict, self).__getitem__(key)
 
 
-NamePartitionKey = PartitionKey(key="name", type_=str)
+NamePartitionKey = PartitionKey.intern(key="name", type_=str)
 
 
 @serializable(recursive_serde=True)
@@ -34,22 +34,29 @@ class DatasetService(AbstractService):
         self, context: AuthedServiceContext, dataset: CreateDataset
     ) -> Union[SyftSuccess, SyftError]:
         """Add a Dataset"""
-        result = self.stash.set(dataset.to(Dataset, context=context))
+        result = self.stash.set(self._to_dataset(context, dataset))
         if result.is_err():
             return SyftError(message=str(result.err()))
         return SyftSuccess(message="Dataset Added")
 
+    @service_method(path="dataset.add_many", name="add_many")
+    def add_many(
+        self, context: AuthedServiceContext, datasets: List[CreateDataset]
+    ) -> Union[SyftSuccess, SyftError]:
+        """Add several Datasets at once"""
+        result = self.stash.set_many(
+            [self._to_dataset(context, dataset) for dataset in datasets]
+        )
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        return SyftSuccess(message=f"{len(datasets)} Datasets Added")
+
     @service_method(path="dataset.get_all", name="get_all")
     def get_all(self, context: AuthedServiceContext) -> Union[List[Dataset], SyftError]:
         """Get a Dataset"""
         result = self.stash.get_all()
         if result.is_ok():
-            datasets = result.ok()
-            results = []
-            for dataset in datasets:
-                dataset.node_uid = context.node.id
-                results.append(dataset)
-            return results
+            return [self._with_node_uid(context, dataset) for dataset in result.ok()]
         return SyftError(message=result.err())
 
     @service_method(path="dataset.get_by_id", name="get_by_id")
@@ -60,10 +67,28 @@ class DatasetService(AbstractService):
         result = self.stash.get_by_uid(uid=uid)
         if result.is_ok():
             dataset = result.ok()
-            dataset.node_uid = context.node.id
-            return dataset
+            if dataset is None:
+                return dataset
+            return self._with_node_uid(context, dataset)
         return SyftError(message=result.err())
 
+    @staticmethod
+    def _to_dataset(context: AuthedServiceContext, dataset: CreateDataset) -> Dataset:
+        # datasets never move between nodes, so the node_uid is set once when
+        # the dataset is stored rather than on every read
+        dataset = dataset.to(Dataset, context=context)
+        dataset.node_uid = context.node.id
+        return dataset
+
+    @staticmethod
+    def _with_node_uid(context: AuthedServiceContext, dataset: Dataset) -> Dataset:
+        # datasets stored before node_uid was set on add have none, or lack the
+        # attribute altogether as serde restores fields with setattr, those
+        # still get it on every read
+        if getattr(dataset, "node_uid", None) is None:
+            dataset.node_uid = context.node.id
+        return dataset
+
 
 TYPE_TO_SERVICE[Dataset] = DatasetService
 SERVICE_TO_TYPES[DatasetService].update({Dataset})
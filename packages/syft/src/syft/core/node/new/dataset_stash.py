@@ -15,7 +15,7 @@ from .document_store import PartitionKey
 from .document_store import PartitionSettings
 from .document_store import QueryKeys
 
-NamePartitionKey = PartitionKey(key="name", type_=str)
+NamePartitionKey = PartitionKey.intern(key="name", type_=str)
 
 
 @instrument
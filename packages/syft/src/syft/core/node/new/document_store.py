@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 # stdlib
+from operator import attrgetter
 from typing import Any
+from typing import Callable
 from typing import Dict
-from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -13,6 +14,8 @@ from typing import Union
 
 # third party
 from pydantic import BaseModel
+from pydantic import PrivateAttr
+from pydantic import validator
 from result import Err
 from result import Ok
 from result import Result
@@ -43,15 +46,43 @@ class StoreClientConfig(BaseModel):
     pass
 
 
+# shared PartitionKey instances, see PartitionKey.intern
+_PK_INTERN: Dict[Tuple[str, type], PartitionKey] = {}
+
+
 @serializable(recursive_serde=True)
 class PartitionKey(BaseModel):
     key: str
     type_: type
+    _hash: Optional[int] = PrivateAttr(default=None)
+
+    class Config:
+        # keep the same instance when validated as a field of another model,
+        # the keys are never mutated and this preserves interned keys
+        copy_on_model_validation = "none"
 
     def __eq__(self, other: Any) -> bool:
-        if type(other) == type(self):
-            return self.key == other.key and self.type_ == other.type_
-        return False
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return False
+        return self.key == other.key and self.type_ is other.type_
+
+    def __hash__(self) -> int:
+        # computed once, partition keys are hashed for every query key
+        if self._hash is None:
+            self._hash = hash((self.key, self.type_))
+        return self._hash
+
+    @staticmethod
+    def intern(key: str, type_: type) -> PartitionKey:
+        # module level keys are created through here so equal keys are the
+        # same object and set / dict lookups can match them by identity
+        partition_key = _PK_INTERN.get((key, type_), None)
+        if partition_key is None:
+            partition_key = PartitionKey(key=key, type_=type_)
+            _PK_INTERN[(key, type_)] = partition_key
+        return partition_key
 
     def with_obj(self, obj: SyftObject) -> QueryKey:
         return QueryKey.from_obj(partition_key=self, obj=obj)
@@ -60,12 +91,23 @@ class PartitionKey(BaseModel):
 @serializable(recursive_serde=True)
 class PartitionKeys(BaseModel):
     pks: Union[PartitionKey, Tuple[PartitionKey, ...]]
+    _accessors: Optional[Tuple[Callable[[Any], Any], ...]] = PrivateAttr(default=None)
+
+    @validator("pks", pre=True, always=True)
+    def make_pks_tuple(cls, v: Any) -> Tuple[PartitionKey, ...]:
+        # always stored as a Tuple, even for a single value, so all is a read
+        return tuple(v) if isinstance(v, (tuple, list)) else (v,)
+
+    @property
+    def all(self) -> Tuple[PartitionKey, ...]:
+        return self.pks
 
     @property
-    def all(self) -> Iterable[PartitionKey]:
-        # make sure we always return Tuple's even if theres a single value
-        _keys = self.pks if isinstance(self.pks, (tuple, list)) else (self.pks,)
-        return _keys
+    def accessors(self) -> Tuple[Callable[[Any], Any], ...]:
+        # one attrgetter per key in all, built once since the keys never change
+        if self._accessors is None:
+            self._accessors = tuple(attrgetter(pk.key) for pk in self.all)
+        return self._accessors
 
     def with_obj(self, obj: SyftObject) -> QueryKeys:
         return QueryKeys.from_obj(partition_keys=self, obj=obj)
@@ -80,7 +122,7 @@ class PartitionKeys(BaseModel):
     def from_dict(cks_dict: Dict[str, type]) -> PartitionKeys:
         pks = []
         for k, t in cks_dict.items():
-            pks.append(PartitionKey(key=k, type_=t))
+            pks.append(PartitionKey.intern(key=k, type_=t))
         return PartitionKeys(pks=pks)
 
     def make(self, *obj_arg: Union[SyftObject, Tuple[Any, ...]]) -> QueryKeys:
@@ -90,22 +132,33 @@ class PartitionKeys(BaseModel):
             return self.with_tuple(*obj_arg)
 
 
+def _validated_value(pk_value: Any, pk_type: type, allow_empty: bool = False) -> Any:
+    if (allow_empty and not pk_value) or isinstance(pk_value, pk_type):
+        return pk_value
+    raise Exception(
+        f"PartitionKey {pk_value} of type {type(pk_value)} must be {pk_type}."
+    )
+
+
 @serializable(recursive_serde=True)
 class QueryKey(PartitionKey):
     value: Any
 
     def __eq__(self, other: Any) -> bool:
-        if type(other) == type(self):
-            return (
-                self.key == other.key
-                and self.type_ == other.type_
-                and self.value == other.value
-            )
-        return False
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return False
+        return (
+            self.key == other.key
+            and self.type_ is other.type_
+            and self.value == other.value
+        )
 
     @property
     def partition_key(self) -> PartitionKey:
-        return PartitionKey(key=self.key, type_=self.type_)
+        # the interned key, rather than building a new PartitionKey every time
+        return PartitionKey.intern(key=self.key, type_=self.type_)
 
     @staticmethod
     def from_obj(partition_key: PartitionKey, obj: SyftObject) -> List[Any]:
@@ -115,13 +168,10 @@ class QueryKey(PartitionKey):
         if isinstance(obj, pk_type):
             pk_value = obj
         else:
-            pk_value = getattr(obj, pk_key)
+            pk_value = _validated_value(getattr(obj, pk_key), pk_type, allow_empty=True)
 
-        if pk_value and not isinstance(pk_value, pk_type):
-            raise Exception(
-                f"PartitionKey {pk_value} of type {type(pk_value)} must be {pk_type}."
-            )
-        return QueryKey(key=pk_key, type_=pk_type, value=pk_value)
+        # the value was type checked above so skip pydantic validation
+        return QueryKey.construct(key=pk_key, type_=pk_type, value=pk_value)
 
 
 @serializable(recursive_serde=True)
@@ -129,61 +179,62 @@ class PartitionKeysWithUID(PartitionKeys):
     uid_pk: PartitionKey
 
     @property
-    def all(self) -> Iterable[PartitionKey]:
-        all_keys = self.pks if isinstance(self.pks, (tuple, list)) else [self.pks]
-        if self.uid_pk not in all_keys:
-            all_keys.insert(0, self.uid_pk)
-        return all_keys
+    def all(self) -> Tuple[PartitionKey, ...]:
+        if self.uid_pk not in self.pks:
+            return (self.uid_pk,) + self.pks
+        return self.pks
 
 
 @serializable(recursive_serde=True)
 class QueryKeys(SyftBaseModel):
     qks: Union[QueryKey, Tuple[QueryKey, ...]]
 
+    @validator("qks", pre=True, always=True)
+    def make_qks_tuple(cls, v: Any) -> Tuple[QueryKey, ...]:
+        # always stored as a Tuple, even for a single value, so all is a read
+        return tuple(v) if isinstance(v, (tuple, list)) else (v,)
+
     @property
-    def all(self) -> Iterable[QueryKey]:
-        # make sure we always return Tuple's even if theres a single value
-        _keys = self.qks if isinstance(self.qks, (tuple, list)) else (self.qks,)
-        return _keys
+    def all(self) -> Tuple[QueryKey, ...]:
+        return self.qks
 
     @staticmethod
     def from_obj(partition_keys: PartitionKeys, obj: SyftObject) -> QueryKeys:
-        qks = []
-        for partition_key in partition_keys.all:
-            pk_key = partition_key.key
-            pk_type = partition_key.type_
-            pk_value = getattr(obj, pk_key)
-            if pk_value and not isinstance(pk_value, pk_type):
-                raise Exception(
-                    f"PartitionKey {pk_value} of type {type(pk_value)} must be {pk_type}."
-                )
-            qk = QueryKey(key=pk_key, type_=pk_type, value=pk_value)
-            qks.append(qk)
-        return QueryKeys(qks=qks)
+        qks = tuple(
+            QueryKey.construct(
+                key=pk.key,
+                type_=pk.type_,
+                value=_validated_value(accessor(obj), pk.type_, allow_empty=True),
+            )
+            for pk, accessor in zip(partition_keys.all, partition_keys.accessors)
+        )
+        return QueryKeys.construct(qks=qks)
 
     @staticmethod
     def from_tuple(partition_keys: PartitionKeys, args: Tuple[Any, ...]) -> QueryKeys:
-        qks = []
-        for partition_key, pk_value in zip(partition_keys.all, args):
-            pk_key = partition_key.key
-            pk_type = partition_key.type_
-            if not isinstance(pk_value, pk_type):
-                raise Exception(
-                    f"PartitionKey {pk_value} of type {type(pk_value)} must be {pk_type}."
-                )
-            qk = QueryKey(key=pk_key, type_=pk_type, value=pk_value)
-            qks.append(qk)
-        return QueryKeys(qks=qks)
+        qks = tuple(
+            QueryKey.construct(
+                key=pk.key, type_=pk.type_, value=_validated_value(pk_value, pk.type_)
+            )
+            for pk, pk_value in zip(partition_keys.all, args)
+        )
+        return QueryKeys.construct(qks=qks)
 
     @staticmethod
     def from_dict(qks_dict: Dict[str, Any]) -> QueryKeys:
-        qks = []
-        for k, v in qks_dict.items():
-            qks.append(QueryKey(key=k, type_=type(v), value=v))
-        return QueryKeys(qks=qks)
+        qks = tuple(
+            QueryKey.construct(key=k, type_=type(v), value=v)
+            for k, v in qks_dict.items()
+        )
+        return QueryKeys.construct(qks=qks)
+
 
+UIDPartitionKey = PartitionKey.intern(key="id", type_=UID)
 
-UIDPartitionKey = PartitionKey(key="id", type_=UID)
+# the keys only depend on the object type (and store key) so they are built
+# once per type and shared by every PartitionSettings for it
+_UNIQUE_KEYS_CACHE: Dict[Tuple[type, str, type], PartitionKeys] = {}
+_SEARCHABLE_KEYS_CACHE: Dict[type, PartitionKeys] = {}
 
 
 @serializable(recursive_serde=True)
@@ -193,12 +244,24 @@ class PartitionSettings(BasePartitionSettings):
 
     @property
     def unique_keys(self) -> PartitionKeys:
-        unique_keys = PartitionKeys.from_dict(self.object_type._syft_unique_keys_dict())
-        return unique_keys.add(self.store_key)
+        cache_key = (self.object_type, self.store_key.key, self.store_key.type_)
+        unique_keys = _UNIQUE_KEYS_CACHE.get(cache_key, None)
+        if unique_keys is None:
+            unique_keys = PartitionKeys.from_dict(
+                self.object_type._syft_unique_keys_dict()
+            ).add(self.store_key)
+            _UNIQUE_KEYS_CACHE[cache_key] = unique_keys
+        return unique_keys
 
     @property
     def searchable_keys(self) -> PartitionKeys:
-        return PartitionKeys.from_dict(self.object_type._syft_searchable_keys_dict())
+        searchable_keys = _SEARCHABLE_KEYS_CACHE.get(self.object_type, None)
+        if searchable_keys is None:
+            searchable_keys = PartitionKeys.from_dict(
+                self.object_type._syft_searchable_keys_dict()
+            )
+            _SEARCHABLE_KEYS_CACHE[self.object_type] = searchable_keys
+        return searchable_keys
 
 
 @instrument
@@ -214,16 +277,25 @@ class StorePartition:
         self.init_store()
 
     def init_store(self) -> None:
-        self.unique_cks = self.settings.unique_keys.all
-        self.searchable_cks = self.settings.searchable_keys.all
+        # frozensets as query_all checks every query key against these
+        self.unique_cks = frozenset(self.settings.unique_keys.all)
+        self.searchable_cks = frozenset(self.settings.searchable_keys.all)
+        # which of the two a key is in, so query_all needs one lookup per key
+        self._ck_kind = {pk: "s" for pk in self.searchable_cks}
+        self._ck_kind.update({pk: "u" for pk in self.unique_cks})
 
     def store_query_key(self, obj: Any) -> QueryKey:
         return self.settings.store_key.with_obj(obj)
 
     def store_query_keys(self, objs: Any) -> QueryKeys:
-        return QueryKeys(qks=[self.store_query_key(obj) for obj in objs])
+        return QueryKeys.construct(qks=tuple(self.store_query_key(obj) for obj in objs))
 
-    def find_index_or_search_keys(self, index_qks: QueryKeys, search_qks: QueryKeys):
+    def find_index_or_search_keys(
+        self,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        limit: Optional[int] = None,
+    ):
         raise NotImplementedError
 
     def all(self) -> Result[List[BaseStash.object_type], str]:
@@ -232,6 +304,14 @@ class StorePartition:
     def set(self, obj: SyftObject) -> Result[SyftObject, str]:
         raise NotImplementedError
 
+    def set_many(self, objs: List[SyftObject]) -> Result[List[SyftObject], str]:
+        # partitions which can write in bulk override this
+        for obj in objs:
+            result = self.set(obj=obj)
+            if result.is_err():
+                return result
+        return Ok(objs)
+
     def update(self, qk: QueryKey, obj: SyftObject) -> Result[SyftObject, str]:
         raise NotImplementedError
 
@@ -288,30 +368,38 @@ class BaseStash:
     def set(self, obj: BaseStash.object_type) -> Result[BaseStash.object_type, str]:
         return self.partition.set(obj=obj)
 
+    def set_many(
+        self, objs: List[BaseStash.object_type]
+    ) -> Result[List[BaseStash.object_type], str]:
+        return self.partition.set_many(objs=objs)
+
     def query_all(
-        self, qks: Union[QueryKey, QueryKeys]
+        self, qks: Union[QueryKey, QueryKeys], limit: Optional[int] = None
     ) -> Result[List[BaseStash.object_type], str]:
         if isinstance(qks, QueryKey):
-            qks = QueryKeys(qks=qks)
+            # a single key is already a QueryKey so skip validating it again
+            qks = QueryKeys.construct(qks=(qks,))
 
         unique_keys = []
         searchable_keys = []
 
+        ck_kind = self.partition._ck_kind
         for qk in qks.all:
-            pk = qk.partition_key
-            if pk in self.partition.unique_cks:
+            kind = ck_kind.get(qk.partition_key, None)
+            if kind == "u":
                 unique_keys.append(qk)
-            elif pk in self.partition.searchable_cks:
+            elif kind == "s":
                 searchable_keys.append(qk)
             else:
                 return Err(
                     f"{qk} not in {type(self.partition)} unique or searchable keys"
                 )
 
-        index_qks = QueryKeys(qks=unique_keys)
-        search_qks = QueryKeys(qks=searchable_keys)
+        # both lists only hold QueryKeys from qks so they need no validation
+        index_qks = QueryKeys.construct(qks=tuple(unique_keys))
+        search_qks = QueryKeys.construct(qks=tuple(searchable_keys))
         return self.partition.find_index_or_search_keys(
-            index_qks=index_qks, search_qks=search_qks
+            index_qks=index_qks, search_qks=search_qks, limit=limit
         )
 
     def query_all_kwargs(
@@ -323,13 +411,15 @@ class BaseStash:
     def query_one(
         self, qks: Union[QueryKey, QueryKeys]
     ) -> Result[Optional[BaseStash.object_type], str]:
-        return self.query_all(qks=qks).and_then(first_or_none)
+        # only the first match is used so the partition can stop after one
+        return self.query_all(qks=qks, limit=1).and_then(first_or_none)
 
     def query_one_kwargs(
         self,
         **kwargs: Dict[str, Any],
     ) -> Result[Optional[BaseStash.object_type], str]:
-        return self.query_all_kwargs(**kwargs).and_then(first_or_none)
+        qks = QueryKeys.from_dict(kwargs)
+        return self.query_one(qks=qks)
 
     def find_all(
         self, **kwargs: Dict[str, Any]
@@ -375,14 +465,22 @@ class BaseUIDStoreStash(BaseStash):
     def get_by_uid(
         self, uid: UID
     ) -> Result[Optional[BaseUIDStoreStash.object_type], str]:
-        qks = QueryKeys(qks=[UIDPartitionKey.with_obj(uid)])
-        return self.query_one(qks=qks)
+        return self.query_one(qks=UIDPartitionKey.with_obj(uid))
 
     def set(
         self, obj: BaseUIDStoreStash.object_type
     ) -> Result[BaseUIDStoreStash.object_type, str]:
         return self.check_type(obj, self.object_type).and_then(super().set)
 
+    def set_many(
+        self, objs: List[BaseUIDStoreStash.object_type]
+    ) -> Result[List[BaseUIDStoreStash.object_type], str]:
+        for obj in objs:
+            result = self.check_type(obj, self.object_type)
+            if result.is_err():
+                return result
+        return super().set_many(objs=objs)
+
 
 @serializable(recursive_serde=True)
 class StoreConfig(SyftBaseObject):
@@ -4,6 +4,7 @@ from __future__ import annotations
 # stdlib
 from collections import defaultdict
 from enum import Enum
+from itertools import islice
 from typing import Any
 from typing import List
 from typing import Optional
@@ -178,7 +179,10 @@ class KeyValueStorePartition(StorePartition):
         return Ok(list(self.data.values()))
 
     def find_index_or_search_keys(
-        self, index_qks: QueryKeys, search_qks: QueryKeys
+        self,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        limit: Optional[int] = None,
     ) -> Result[List[SyftObject], str]:
         ids: Optional[Set] = None
         errors = []
@@ -205,6 +209,9 @@ class KeyValueStorePartition(StorePartition):
         if len(errors) > 0:
             return Err(" ".join(errors))
 
+        if limit is not None:
+            ids = islice(ids, limit)
+
         qks = self.store_query_keys(ids)
         return self.get_all_from_store(qks=qks)
 
@@ -244,9 +251,11 @@ class KeyValueStorePartition(StorePartition):
                 searchable_query_keys=_original_searchable_keys,
             )
 
-            # update the object with new data
-            for key, value in obj.to_dict().items():
-                setattr(_original_obj, key, value)
+            # update the object with new data, unless it is the stored object
+            # which was changed in place, like after a get_by_uid
+            if obj is not _original_obj:
+                for key, value in obj.to_dict().items():
+                    setattr(_original_obj, key, value)
 
             # update data and keys
             self.set_data_and_keys(
@@ -1,5 +1,7 @@
 # stdlib
+from functools import lru_cache
 from typing import List
+from typing import Tuple
 
 # third party
 from result import Err
@@ -13,17 +15,26 @@ from .credentials import SyftVerifyKey
 from .document_store import BaseUIDStoreStash
 from .document_store import PartitionKey
 from .document_store import PartitionSettings
+from .document_store import QueryKey
 from .document_store import QueryKeys
 from .messages import Message
 from .messages import MessageStatus
 
-FromUserVerifyKeyPartitionKey = PartitionKey(
+FromUserVerifyKeyPartitionKey = PartitionKey.intern(
     key="from_user_verify_key", type_=SyftVerifyKey
 )
-ToUserVerifyKeyPartitionKey = PartitionKey(
+ToUserVerifyKeyPartitionKey = PartitionKey.intern(
     key="to_user_verify_key", type_=SyftVerifyKey
 )
-StatusPartitionKey = PartitionKey(key="status", type_=MessageStatus)
+StatusPartitionKey = PartitionKey.intern(key="status", type_=MessageStatus)
+
+
+@lru_cache(maxsize=1024)
+def _qks_from_verify_key(verify_key: SyftVerifyKey) -> Tuple[QueryKey, QueryKey]:
+    return (
+        FromUserVerifyKeyPartitionKey.with_obj(verify_key),
+        ToUserVerifyKeyPartitionKey.with_obj(verify_key),
+    )
 
 
 @instrument
@@ -40,12 +51,7 @@ class MessageStash(BaseUIDStoreStash):
     ) -> Result[List[Message], str]:
         if isinstance(verify_key, str):
             verify_key = SyftVerifyKey.from_string(verify_key)
-        qks = QueryKeys(
-            qks=[
-                FromUserVerifyKeyPartitionKey.with_obj(verify_key),
-                ToUserVerifyKeyPartitionKey.with_obj(verify_key),
-            ]
-        )
+        qks = QueryKeys.construct(qks=_qks_from_verify_key(verify_key))
         return self.query_all(qks=qks)
 
     def get_all_by_verify_key_for_status(
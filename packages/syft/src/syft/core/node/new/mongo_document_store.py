@@ -6,6 +6,7 @@ from typing import Type
 
 # third party
 from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError
 from pymongo.errors import DuplicateKeyError
 from result import Err
 from result import Ok
@@ -166,6 +167,17 @@ class MongoStorePartition(StorePartition):
 
         return Ok(obj)
 
+    def set_many(self, objs: List[SyftObject]) -> Result[List[SyftObject], str]:
+        if not objs:
+            return Ok(objs)
+        storage_objs = [obj.to(self.storage_type) for obj in objs]
+        try:
+            self.collection.insert_many(storage_objs)
+        except BulkWriteError as e:
+            return Err(f"Failed to write objs. {e}")
+
+        return Ok(objs)
+
     def _create_filter(self, qks: QueryKeys) -> Dict:
         query_filter = {}
         for qk in qks.all:
@@ -196,15 +208,22 @@ class MongoStorePartition(StorePartition):
         return Ok(obj)
 
     def find_index_or_search_keys(
-        self, index_qks: QueryKeys, search_qks: QueryKeys
+        self,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        limit: Optional[int] = None,
     ) -> Result[List[SyftObject], str]:
         # TODO: pass index as hint to find method
         qks = QueryKeys(qks=(index_qks.all + search_qks.all))
-        return self.get_all_from_store(qks=qks)
+        return self.get_all_from_store(qks=qks, limit=limit)
 
-    def get_all_from_store(self, qks: QueryKeys) -> Result[List[SyftObject], str]:
+    def get_all_from_store(
+        self, qks: QueryKeys, limit: Optional[int] = None
+    ) -> Result[List[SyftObject], str]:
         query_filter = self._create_filter(qks=qks)
         storage_objs = self.collection.find(filter=query_filter)
+        if limit is not None:
+            storage_objs = storage_objs.limit(limit)
         syft_objs = []
         for storage_obj in storage_objs:
             obj = self.storage_type(storage_obj)
@@ -44,7 +44,7 @@ from .transforms import transform
 from .transforms import transform_method
 from .worker_settings import WorkerSettings
 
-VerifyKeyPartitionKey = PartitionKey(key="verify_key", type_=SyftVerifyKey)
+VerifyKeyPartitionKey = PartitionKey.intern(key="verify_key", type_=SyftVerifyKey)
 
 
 class NodeRoute:
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 # stdlib
+from functools import lru_cache
 from typing import Callable
 from typing import List
+from typing import Tuple
 
 # third party
 from packaging import version
@@ -22,18 +24,29 @@ from ..new.transforms import rename
 from .transforms import transform
 
 
+@lru_cache(maxsize=16)
+def _compare_versions(client_version: str, server_version: str) -> Tuple[bool, bool]:
+    # parsing is the expensive part and only a few version pairs are ever seen,
+    # the warning and the exception are still raised on every call
+    client_syft_version = version.parse(client_version)
+    node_syft_version = version.parse(server_version)
+    return (
+        client_syft_version.base_version == node_syft_version.base_version,
+        client_syft_version.pre == node_syft_version.pre,
+    )
+
+
 def check_version(
     client_version: str, server_version: str, server_name: str, silent: bool = False
 ) -> bool:
-    client_syft_version = version.parse(client_version)
-    node_syft_version = version.parse(server_version)
+    base_matches, pre_matches = _compare_versions(client_version, server_version)
     msg = (
         f"You are running syft=={client_version} but "
         f"{server_name} node requires {server_version}"
     )
-    if client_syft_version.base_version != node_syft_version.base_version:
+    if not base_matches:
         raise Exception(msg)
-    if client_syft_version.pre != node_syft_version.pre:
+    if not pre_matches:
         if not silent:
             print(f"Warning: {msg}")
             return False
@@ -16,10 +16,10 @@ from .request import Request
 from .request import RequestStatus
 from .response import SyftError
 
-RequestingUserVerifyKeyPartitionKey = PartitionKey(
+RequestingUserVerifyKeyPartitionKey = PartitionKey.intern(
     key="requesting_user_verify_key", type_=SyftVerifyKey
 )
-StatusPartitionKey = PartitionKey(key="status", type_=RequestStatus)
+StatusPartitionKey = PartitionKey.intern(key="status", type_=RequestStatus)
 
 
 @instrument
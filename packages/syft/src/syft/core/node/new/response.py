@@ -1,7 +1,19 @@
+# stdlib
+from typing import Any
+
 # relative
+from ...common.serde.deserialize import _deserialize
 from ...common.serde.serializable import serializable
+from ...common.serde.serialize import _serialize
 from .base import SyftBaseModel
 
+# api_call responses are only tagged when the client asks for this media type,
+# so clients and nodes on older versions keep exchanging plain serde bytes
+TAGGED_RESPONSE_MEDIA_TYPE = "application/x-syft-tagged"
+_TAG_SUCCESS = 0
+_TAG_ERROR = 1
+_TAG_SERDE = 2
+
 
 class SyftResponseMessage(SyftBaseModel):
     message: str
@@ -63,3 +75,22 @@ class SyftException(Exception):
             f'<div class="{self._repr_html_class_}" style="padding:5px;">'
             + f"<strong>{type(self).__name__}</strong>: {self.args}</div><br />"
         )
+
+
+def encode_tagged_response(result: Any) -> bytes:
+    # plain success and error messages are sent as utf-8 text after the tag
+    # byte so the client does not need to run the deserializer for them
+    if type(result) is SyftSuccess:
+        return bytes((_TAG_SUCCESS,)) + result.message.encode("utf-8")
+    if type(result) is SyftError:
+        return bytes((_TAG_ERROR,)) + result.message.encode("utf-8")
+    return bytes((_TAG_SERDE,)) + _serialize(result, to_bytes=True)
+
+
+def decode_tagged_response(content: bytes) -> Any:
+    tag = content[0]
+    if tag == _TAG_SUCCESS:
+        return SyftSuccess(message=content[1:].decode("utf-8"))
+    if tag == _TAG_ERROR:
+        return SyftError(message=content[1:].decode("utf-8"))
+    return _deserialize(content[1:], from_bytes=True)
@@ -1,20 +1,26 @@
 # stdlib
 import ast
 from enum import Enum
+from functools import lru_cache
 import hashlib
 import inspect
 from inspect import Parameter
 from inspect import Signature
 from io import StringIO
 import sys
+import textwrap
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
+# third party
+from pydantic import validator
+
 # relative
 from ....core.node.common.node_table.syft_object import SYFT_OBJECT_VERSION_1
 from ....core.node.common.node_table.syft_object import SyftObject
@@ -30,8 +36,10 @@ from .transforms import generate_id
 from .transforms import transform
 from .user_code_parse import GlobalsVisitor
 
-UserVerifyKeyPartitionKey = PartitionKey(key="user_verify_key", type_=SyftVerifyKey)
-CodeHashPartitionKey = PartitionKey(key="code_hash", type_=int)
+UserVerifyKeyPartitionKey = PartitionKey.intern(
+    key="user_verify_key", type_=SyftVerifyKey
+)
+CodeHashPartitionKey = PartitionKey.intern(key="code_hash", type_=int)
 
 PyCodeObject = Any
 
@@ -65,7 +73,8 @@ def allowed_ids_only(
         if key in kwargs:
             value = kwargs[key]
             uid = value
-            if not isinstance(uid, UID):
+            # exact type first, the isinstance walk only for anything else
+            if type(uid) is not UID and not isinstance(uid, UID):
                 uid = getattr(value, "id", None)
 
             if uid != allowed_inputs[key]:
@@ -181,7 +190,7 @@ class UserCode(SyftObject):
     service_func_name: str
     unique_func_name: str
     user_unique_func_name: str
-    code_hash: str
+    code_hash: int
     signature: inspect.Signature
     status: UserCodeStatus = UserCodeStatus.SUBMITTED
 
@@ -189,27 +198,54 @@ class UserCode(SyftObject):
     __attr_unique__ = ["user_verify_key", "code_hash", "user_unique_func_name"]
     __attr_repr_cols__ = ["status", "service_func_name"]
 
+    @validator("code_hash", pre=True)
+    def rehash_hex_code_hash(cls, v: Any, values: Dict[str, Any]) -> Any:
+        # records stored before code_hash became an int hold the sha256 hex
+        # digest, serde rebuilds them through __init__ so they are rehashed
+        # here and lookups and the unique check only ever see the int form.
+        # The partition's unique key index keeps the hex value for such a
+        # record until it is written again
+        if isinstance(v, str) and "raw_code" in values:
+            return compute_code_hash(values["raw_code"])
+        return v
+
     @property
     def byte_code(self) -> Optional[PyCodeObject]:
         return compile_byte_code(self.parsed_code)
 
 
-def extract_uids(kwargs: Dict[str, Any]) -> Dict[str, UID]:
-    # relative
-    from .action_object import ActionObject
-    from .twin_object import TwinObject
+# (ActionObject, TwinObject), see _action_types
+_ACTION_TYPES: Optional[Tuple[type, ...]] = None
+
+
+def _action_types() -> Tuple[type, ...]:
+    # action_object imports the client and through its api this module, so the
+    # import can't be at the top, resolve it on first use and keep the result
+    global _ACTION_TYPES
+    if _ACTION_TYPES is None:
+        # relative
+        from .action_object import ActionObject
+        from .twin_object import TwinObject
 
+        _ACTION_TYPES = (ActionObject, TwinObject)
+    return _ACTION_TYPES
+
+
+def extract_uids(kwargs: Dict[str, Any]) -> Dict[str, UID]:
+    action_types = _action_types()
     uid_kwargs = {}
     for k, v in kwargs.items():
         uid = v
-        if isinstance(v, ActionObject):
-            uid = v.id
-        if isinstance(v, TwinObject):
+        # plain UIDs are the common case, ActionObject has subclasses so the
+        # other checks stay isinstance but stop at the first match
+        if type(v) is UID:
+            pass
+        elif isinstance(v, action_types):
             uid = v.id
-        if isinstance(v, Asset):
+        elif isinstance(v, Asset):
             uid = v.action_id
 
-        if not isinstance(uid, UID):
+        if type(uid) is not UID and not isinstance(uid, UID):
             raise Exception(f"Input {k} must have a UID not {type(v)}")
 
         uid_kwargs[k] = uid
@@ -296,24 +332,33 @@ def generate_unique_func_name(context: TransformContext) -> TransformContext:
     return context
 
 
-def process_code(
-    raw_code: str,
-    func_name: str,
-    original_func_name: str,
-    input_policy: InputPolicy,
-    output_policy: OutputPolicy,
-) -> str:
-    input_kwargs = input_policy.inputs
-    outputs = output_policy.outputs
+_INDENT = "    "
 
-    tree = ast.parse(raw_code)
 
-    # check there are no globals
-    v = GlobalsVisitor()
-    v.visit(tree)
+def _has_multiline_strings(tree: ast.AST) -> bool:
+    # indenting the source would change the contents of these literals
+    return any(
+        isinstance(node, (ast.Constant, ast.JoinedStr))
+        and node.end_lineno != node.lineno
+        for node in ast.walk(tree)
+    )
+
 
+def _has_tab_indentation(raw_code: str) -> bool:
+    # mixing the template's spaces with tabs raises a TabError
+    return any(
+        "\t" in line[: len(line) - len(line.lstrip())] for line in raw_code.splitlines()
+    )
+
+
+def _wrap_with_ast(
+    tree: ast.Module,
+    func_name: str,
+    original_func_name: str,
+    input_kwargs: Tuple[str, ...],
+    outputs: Tuple[str, ...],
+) -> str:
     f = tree.body[0]
-    f.decorator_list = []
 
     keywords = [ast.keyword(arg=i, value=[ast.Name(id=i)]) for i in input_kwargs]
     call_stmt = ast.Assign(
@@ -359,6 +404,73 @@ def process_code(
     return ast.unparse(wrapper_function)
 
 
+@lru_cache(maxsize=128)
+def _process_code(
+    raw_code: str,
+    func_name: str,
+    original_func_name: str,
+    input_kwargs: Tuple[str, ...],
+    outputs: Tuple[str, ...],
+) -> str:
+    tree = ast.parse(raw_code)
+
+    # check there are no globals
+    v = GlobalsVisitor()
+    v.visit(tree)
+
+    f = tree.body[0]
+    decorators = f.decorator_list
+    f.decorator_list = []
+
+    if _has_multiline_strings(tree) or _has_tab_indentation(raw_code):
+        return _wrap_with_ast(
+            tree=tree,
+            func_name=func_name,
+            original_func_name=original_func_name,
+            input_kwargs=input_kwargs,
+            outputs=outputs,
+        )
+
+    # the wrapper is always the same, so rather than building it as AST and
+    # unparsing the whole tree the user source is indented into a template
+    lines = raw_code.splitlines()
+    if decorators:
+        # f.lineno is the line of the def itself, after the decorators
+        del lines[decorators[0].lineno - 1 : f.lineno - 1]
+    body = textwrap.indent("\n".join(lines), _INDENT)
+
+    call_kwargs = ", ".join(f"{k}={k}" for k in input_kwargs)
+    if len(outputs) > 0:
+        return_annotation = "Dict[str, Any]"
+        return_value = f"{{k: result[k] for k in {list(outputs)!r}}}"
+    else:
+        return_annotation = "Any"
+        return_value = "result"
+
+    return (
+        f"def {func_name}({ast.unparse(f.args)}) -> {return_annotation}:\n"
+        f"{body}\n"
+        f"{_INDENT}result = {original_func_name}({call_kwargs})\n"
+        f"{_INDENT}return {return_value}\n"
+    )
+
+
+def process_code(
+    raw_code: str,
+    func_name: str,
+    original_func_name: str,
+    input_policy: InputPolicy,
+    output_policy: OutputPolicy,
+) -> str:
+    return _process_code(
+        raw_code=raw_code,
+        func_name=func_name,
+        original_func_name=original_func_name,
+        input_kwargs=tuple(input_policy.inputs),
+        outputs=tuple(output_policy.outputs),
+    )
+
+
 def new_check_code(context: TransformContext) -> TransformContext:
     try:
         processed_code = process_code(
@@ -376,9 +488,15 @@ def new_check_code(context: TransformContext) -> TransformContext:
     return context
 
 
+@lru_cache(maxsize=256)
+def _compile(parsed_code: str) -> PyCodeObject:
+    # failures raise so they are not cached
+    return compile(parsed_code, "<string>", "exec")
+
+
 def compile_byte_code(parsed_code: str) -> Optional[PyCodeObject]:
     try:
-        return compile(parsed_code, "<string>", "exec")
+        return _compile(parsed_code)
     except Exception as e:
         print("WARNING: to compile byte code", e)
     return None
@@ -394,12 +512,21 @@ def compile_code(context: TransformContext) -> TransformContext:
     return context
 
 
+def compute_code_hash(code: str) -> int:
+    # an int to match CodeHashPartitionKey, kept to 63 bits so it fits in a
+    # BSON int64 for the mongo store and is never negative in the func name.
+    # By the birthday bound a collision becomes likely only after about 3.6e9
+    # submissions, and one is rejected by the unique check on code_hash rather
+    # than mixing up two pieces of code
+    digest = hashlib.blake2b(code.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
 def hash_code(context: TransformContext) -> TransformContext:
     code = context.output["code"]
     del context.output["code"]
     context.output["raw_code"] = code
-    code_hash = hashlib.sha256(code.encode("utf8")).hexdigest()
-    context.output["code_hash"] = code_hash
+    context.output["code_hash"] = compute_code_hash(code)
     return context
 
 
@@ -459,6 +586,15 @@ class UserCodeExecutionResult(SyftObject):
     result: Any
 
 
+@lru_cache(maxsize=128)
+def _load_user_function(parsed_code: str, func_name: str) -> Callable:
+    # run the module body once and keep the function it defines, keyed on the
+    # source so it is shared by every copy of the UserCode loaded from a stash
+    namespace: Dict[str, Any] = {}
+    exec(compile_byte_code(parsed_code), globals(), namespace)  # nosec
+    return namespace[func_name]
+
+
 def execute_byte_code(code_item: UserCode, kwargs: Dict[str, Any]) -> Any:
     stdout_ = sys.stdout
     stderr_ = sys.stderr
@@ -470,13 +606,8 @@ def execute_byte_code(code_item: UserCode, kwargs: Dict[str, Any]) -> Any:
         sys.stdout = stdout
         sys.stderr = stderr
 
-        # statisfy lint checker
-        result = None
-
-        exec(code_item.byte_code)  # nosec
-
-        evil_string = f"{code_item.unique_func_name}(**kwargs)"
-        result = eval(evil_string, None, locals())  # nosec
+        func = _load_user_function(code_item.parsed_code, code_item.unique_func_name)
+        result = func(**kwargs)
 
         # restore stdout and stderr
         sys.stdout = stdout_
@@ -1,7 +1,11 @@
 # stdlib
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Tuple
 from typing import Union
 
 # relative
@@ -110,21 +114,79 @@ class UserCodeService(AbstractService):
         except Exception as e:
             return SyftError(message=f"Failed to run. {e}")
 
+    @service_method(path="code.call_many", name="call_many")
+    def call_many(
+        self, context: AuthedServiceContext, calls: List[Tuple[UID, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Call User Code Functions, each code item is read once and its state
+        is written after every successful call"""
+        action_service = context.node.get_service("actionservice")
+        code_items: Dict[UID, UserCode] = {}
+        results: List[Any] = []
+        for uid, kwargs in calls:
+            try:
+                code_item = code_items.get(uid, None)
+                if code_item is None:
+                    result = self.stash.get_by_uid(uid=uid)
+                    if result.is_err():
+                        results.append(SyftError(message=result.err()))
+                        continue
+                    code_item = result.ok()
+                    if code_item is None:
+                        results.append(
+                            SyftError(message=f"No User Code exists for id: {uid}")
+                        )
+                        continue
+                    code_items[uid] = code_item
 
-def filter_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+                is_valid = code_item.output_policy_state.valid
+                if not is_valid:
+                    results.append(is_valid)
+                    continue
+
+                result = action_service._user_code_execute(
+                    context, code_item, filter_kwargs(kwargs)
+                )
+                if result.is_err():
+                    results.append(SyftError(message=result.err()))
+                    continue
+                code_item.output_policy_state.update_state()
+                # persist right away so a later failure can't lose this run
+                state_result = self.update_code_state(
+                    context=context, code_item=code_item
+                )
+                if not state_result:
+                    results.append(state_result)
+                    continue
+                results.append(result.ok())
+            except Exception as e:
+                results.append(SyftError(message=f"Failed to run. {e}"))
+        return results
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=None)
+def _kwarg_extractor(type_: type) -> Callable[[Any], Any]:
+    # resolved once per kwarg type, subclasses match through their mro
     # relative
     from .action_object import ActionObject
     from .dataset import Asset
     from .twin_object import TwinObject
 
-    filtered_kwargs = {}
-    for k, v in kwargs.items():
-        value = v
-        if isinstance(v, ActionObject):
-            value = v.id
-        if isinstance(v, TwinObject):
-            value = v.id
-        if isinstance(v, Asset):
-            value = v.action_id
-        filtered_kwargs[k] = value
-    return filtered_kwargs
+    extractors = {
+        ActionObject: attrgetter("id"),
+        TwinObject: attrgetter("id"),
+        Asset: attrgetter("action_id"),
+    }
+    for base in type_.__mro__:
+        extractor = extractors.get(base, None)
+        if extractor is not None:
+            return extractor
+    return _identity
+
+
+def filter_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _kwarg_extractor(type(v))(v) for k, v in kwargs.items()}
@@ -2,6 +2,7 @@
 from typing import Optional
 
 # third party
+from result import Err
 from result import Ok
 from result import Result
 
@@ -15,15 +16,14 @@ from .document_store import BaseStash
 from .document_store import DocumentStore
 from .document_store import PartitionKey
 from .document_store import PartitionSettings
-from .document_store import QueryKeys
 from .document_store import UIDPartitionKey
 from .response import SyftSuccess
 from .user import User
 
 # 🟡 TODO 27: it would be nice if these could be defined closer to the User
-EmailPartitionKey = PartitionKey(key="email", type_=str)
-SigningKeyPartitionKey = PartitionKey(key="signing_key", type_=SyftSigningKey)
-VerifyKeyPartitionKey = PartitionKey(key="verify_key", type_=SyftVerifyKey)
+EmailPartitionKey = PartitionKey.intern(key="email", type_=str)
+SigningKeyPartitionKey = PartitionKey.intern(key="signing_key", type_=SyftSigningKey)
+VerifyKeyPartitionKey = PartitionKey.intern(key="verify_key", type_=SyftVerifyKey)
 
 
 @instrument
@@ -39,31 +39,30 @@ class UserStash(BaseStash):
         super().__init__(store=store)
 
     def set(self, user: User) -> Result[User, str]:
-        return self.check_type(user, self.object_type).and_then(super().set)
+        # same check as check_type without the Ok wrapper and and_then chain
+        if not isinstance(user, self.object_type):
+            return Err(f"{type(user)} does not match required type: {self.object_type}")
+        return super().set(user)
 
     def get_by_uid(self, uid: UID) -> Result[Optional[User], str]:
-        qks = QueryKeys(qks=[UIDPartitionKey.with_obj(uid)])
-        return self.query_one(qks=qks)
+        return self.query_one(qks=UIDPartitionKey.with_obj(uid))
 
     def get_by_email(self, email: str) -> Result[Optional[User], str]:
-        qks = QueryKeys(qks=[EmailPartitionKey.with_obj(email)])
-        return self.query_one(qks=qks)
+        return self.query_one(qks=EmailPartitionKey.with_obj(email))
 
     def get_by_signing_key(
         self, signing_key: SigningKeyPartitionKey
     ) -> Result[Optional[User], str]:
         if isinstance(signing_key, str):
             signing_key = SyftSigningKey.from_string(signing_key)
-        qks = QueryKeys(qks=[SigningKeyPartitionKey.with_obj(signing_key)])
-        return self.query_one(qks=qks)
+        return self.query_one(qks=SigningKeyPartitionKey.with_obj(signing_key))
 
     def get_by_verify_key(
         self, verify_key: VerifyKeyPartitionKey
     ) -> Result[Optional[User], str]:
         if isinstance(verify_key, str):
             verify_key = SyftVerifyKey.from_string(verify_key)
-        qks = QueryKeys(qks=[VerifyKeyPartitionKey.with_obj(verify_key)])
-        return self.query_one(qks=qks)
+        return self.query_one(qks=VerifyKeyPartitionKey.with_obj(verify_key))
 
     def delete_by_uid(self, uid: UID) -> Result[SyftSuccess, str]:
         qk = UIDPartitionKey.with_obj(uid)
@@ -73,4 +72,6 @@ class UserStash(BaseStash):
         return result
 
     def update(self, user: User) -> Result[User, str]:
-        return self.check_type(user, self.object_type).and_then(super().update)
+        if not isinstance(user, self.object_type):
+            return Err(f"{type(user)} does not match required type: {self.object_type}")
+        return super().update(user)
@@ -1,8 +1,10 @@
 # stdlib
+from functools import lru_cache
 import re
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import cast
 
 # third party
@@ -14,17 +16,78 @@ from ...core.common.serde import _deserialize
 from ...core.common.serde import _serialize
 from ...core.common.serde import recursive_serde_register
 
+# the real torch.return_types, if this torch has one, before it is replaced below
+torch_return_types = torch.__dict__.get("return_types", None)
+
 # TODO: a better way. Loot at https://github.com/OpenMined/PySyft/issues/5249
 module_type = type(torch)
 torch.__dict__["return_types"] = module_type(name="return_types")
 parent = torch.__dict__["return_types"]
 
+# a field name at the start of each line of a return type repr, non greedy so
+# a "dtype=" later in the same line is not included in the name
+FIELD_NAME_RE = re.compile(r"\n(.*?)=")
+
+# the return types which are serializable
+SUPPORTED_RETURN_TYPES = [
+    "cummax",
+    "cummin",
+    "kthvalue",
+    "slogdet",
+    "mode",
+    "sort",
+    "topk",
+    "svd",
+    "geqrf",
+    "median",
+    "max",
+    "min",
+]
+
+
+def get_class_field_names(typ: type) -> Optional[List[str]]:
+    fields = getattr(typ, "_fields", None) or getattr(typ, "__match_args__", None)
+    return list(fields) if fields is not None else None
+
 
 def get_field_names(obj: Any) -> List[str]:
-    return re.findall("\n(.*)=", str(obj))
+    fields = get_class_field_names(type(obj))
+    if fields is not None:
+        return fields
+    # parsing the repr prints every tensor in obj, only used as a last resort
+    return FIELD_NAME_RE.findall(str(obj))
+
+
+def get_type_field_names(typ: type) -> List[str]:
+    fields = get_class_field_names(typ)
+    if fields is not None:
+        return fields
+    # structseq types without either, read the names from an empty instance
+    return get_field_names(typ((None,) * typ.n_sequence_fields))  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def _supported_types_fields(torch_version: str) -> Dict[type, List]:
+    # the fields of each return type are fixed for a torch version, so they
+    # are read from the classes instead of running the ops to get instances
+    if torch_return_types is None or not all(
+        hasattr(torch_return_types, name) for name in SUPPORTED_RETURN_TYPES
+    ):
+        return discover_supported_types_fields()
+
+    supported_types = {}
+    for name in SUPPORTED_RETURN_TYPES:
+        typ = getattr(torch_return_types, name)
+        supported_types[typ] = get_type_field_names(typ)
+    return supported_types
 
 
 def get_supported_types_fields() -> Dict[type, List]:
+    return _supported_types_fields(torch.__version__)
+
+
+def discover_supported_types_fields() -> Dict[type, List]:
+    # for torch versions without torch.return_types, get instances of each type
     supported_types = {}
     # A = torch.tensor([[1.0, 1, 1], [2, 3, 4], [3, 5, 2], [4, 2, 5], [5, 4, 3]])
     # B = torch.tensor([[-10.0, -3], [12, 14], [14, 12], [16, 16], [18, 16]])
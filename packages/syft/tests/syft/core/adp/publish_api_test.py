@@ -11,8 +11,11 @@ import syft as sy
 from syft.core.adp.data_subject_ledger import DataSubjectLedger
 from syft.core.adp.data_subject_ledger import RDPParams
 from syft.core.adp.data_subject_ledger import compute_rdp_constant
+from syft.core.adp.data_subject_ledger import rdp_params_to_eps
 from syft.core.adp.ledger_store import DictLedgerStore
 from syft.core.adp.vectorized_publish import calculate_bounds_for_mechanism
+from syft.core.adp.vectorized_publish import compute_epsilon
+from syft.core.adp.vectorized_publish import publish
 from syft.core.tensor.autodp.gamma_tensor import GammaTensor
 
 
@@ -418,3 +421,69 @@ def test_publish_sigma_affects_pb(dataset: np.ndarray) -> None:
     assert eps2 > eps1, "Decreasing sigma did not increase the epsilon for this query"
 
     assert rdp2 > rdp1, "Was no epsilon spent during the second query?"
+
+
+def test_rdp_params_to_eps_unbucketed_batch() -> None:
+    # three entries are padded to a bucket of four and sliced back
+    rdp_params = RDPParams(
+        sigmas=np.array([10.0, 20.0, 30.0]),
+        l2_norms=np.array([1.0, 2.0, 3.0]),
+        l2_norm_bounds=np.array([4.0, 5.0, 6.0]),
+        Ls=np.array([1.0, 1.0, 1.0]),
+    )
+    ledger = DataSubjectLedger.get_or_create(store=DictLedgerStore(), user_key=b"7251")
+
+    rdp_constants, eps_spend = rdp_params_to_eps(
+        rdp_params, DataSubjectLedger.get_device_cache(), True
+    )
+
+    assert rdp_constants.shape == (3,)
+    assert eps_spend.shape == (3,)
+    assert np.allclose(rdp_constants, compute_rdp_constant(rdp_params, True))
+    assert np.allclose(eps_spend, ledger._get_epsilon_spend(np.asarray(rdp_constants)))
+
+
+def test_compute_epsilon_and_publish() -> None:
+    fred_tensor = sy.Tensor(np.array([25, 35, 21])).annotate_with_dp_metadata(
+        lower_bound=0, upper_bound=122, data_subject="fred"
+    )
+    sally_tensor = sy.Tensor(np.array([8, 11, 10])).annotate_with_dp_metadata(
+        lower_bound=0, upper_bound=122, data_subject="sally"
+    )
+    tensor = (fred_tensor + sally_tensor).child
+    assert isinstance(tensor, GammaTensor)
+
+    ledger = DataSubjectLedger.get_or_create(store=DictLedgerStore(), user_key=b"7252")
+
+    _, epsilon_spend, rdp_constants = compute_epsilon(
+        tensor,
+        privacy_budget=1_000_000,
+        is_linear=True,
+        sigma=50,
+        private=True,
+        ledger=ledger,
+    )
+
+    assert len(rdp_constants) == 2
+    expected_spend = []
+    for rdp_constant in rdp_constants.values():
+        assert not np.isnan(rdp_constant).any()
+        assert not np.isinf(rdp_constant).any()
+        expected_spend.append(np.max(ledger._get_epsilon_spend(rdp_constant)))
+    assert np.isclose(np.max(epsilon_spend), max(expected_spend))
+
+    user_budget.budget = 1_000_000
+    result = publish(
+        tensor,
+        ledger,
+        get_budget_for_user,
+        deduct_epsilon_for_user,
+        sigma=50,
+        is_linear=True,
+        private=True,
+    )
+
+    assert isinstance(result, (np.ndarray, DeviceArray))
+    assert result.shape == (3,)
+    assert len(ledger._rdp_constants) == 2
+    assert user_budget.current_spend > 0
@@ -0,0 +1,92 @@
+# stdlib
+from typing import Any
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+from syft.core.common.serde.arrow import SMALL_ARRAY_NBYTES
+from syft.core.common.serde.arrow import arrow_deserialize
+from syft.core.common.serde.arrow import arrow_serialize
+from syft.core.common.serde.arrow import use_raw_bytes
+from syft.experimental_flags import ApacheArrowCompression
+from syft.experimental_flags import flags
+
+
+@pytest.fixture
+def no_compression(monkeypatch: Any) -> None:
+    # large arrays only skip arrow when it would not compress them
+    monkeypatch.setattr(flags, "APACHE_ARROW_COMPRESSION", ApacheArrowCompression.NONE)
+
+
+@pytest.fixture
+def zstd_compression(monkeypatch: Any) -> None:
+    monkeypatch.setattr(flags, "APACHE_ARROW_COMPRESSION", ApacheArrowCompression.ZSTD)
+
+
+def round_trip(array: np.ndarray) -> np.ndarray:
+    result = arrow_deserialize(arrow_serialize(array))
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert np.array_equal(result, array)
+    assert result.flags["WRITEABLE"]
+    return result
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array(7, dtype=np.int64),
+        np.array(2.5, dtype=np.float32),
+        np.array([], dtype=np.float64),
+        np.zeros((0, 3), dtype=np.int32),
+        np.array([0, 1, 2**32 - 1], dtype=np.uint32),
+        np.array([0, 2**64 - 1], dtype=np.uint64),
+        np.array([True, False, True]),
+        np.array([1 + 2j, 3 - 4j]),
+        np.array(["ab", "c"]),
+        np.array(["2023-01-01", "2023-01-02"], dtype="datetime64[D]"),
+    ],
+)
+def test_small_arrays_round_trip(array: np.ndarray) -> None:
+    assert use_raw_bytes(array)
+    round_trip(array)
+
+
+def test_small_structured_array_keeps_fields() -> None:
+    array = np.zeros(2, dtype=[("a", np.int16), ("b", np.int16)])
+    assert array.nbytes < SMALL_ARRAY_NBYTES
+    # dtype.str of a structured dtype is '|V4', which drops the field names
+    assert not use_raw_bytes(array)
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.uint16, np.int64, np.float64])
+def test_large_arrays_round_trip(dtype: type, no_compression: None) -> None:
+    array = np.arange(10_000).reshape(100, 100).astype(dtype)
+    assert use_raw_bytes(array)
+    round_trip(array)
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.uint16, np.int64, np.float64])
+def test_large_arrays_compressed_round_trip(
+    dtype: type, zstd_compression: None
+) -> None:
+    array = np.arange(10_000).reshape(100, 100).astype(dtype)
+    assert not use_raw_bytes(array)
+    round_trip(array)
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.uint64, np.float32])
+def test_non_contiguous_arrays_round_trip(dtype: type, no_compression: None) -> None:
+    array = np.arange(10_000).reshape(100, 100).astype(dtype)
+    for view in (array.T, array[::2, 1::3]):
+        assert not view.flags["C_CONTIGUOUS"]
+        # goes through the uncompressed arrow reader
+        assert not use_raw_bytes(view)
+        round_trip(view)
+
+    small_view = array[:4:2, :2]
+    assert small_view.nbytes < SMALL_ARRAY_NBYTES
+    assert use_raw_bytes(small_view)
+    round_trip(small_view)
@@ -0,0 +1,60 @@
+# stdlib
+from types import SimpleNamespace
+from typing import Any
+
+# third party
+import numpy as np
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.node.new.action_service import ActionService
+from syft.core.node.new.action_store import DictActionStore
+from syft.core.node.new.credentials import SyftSigningKey
+from syft.core.node.new.numpy import NumpyArrayObject
+
+
+def make_object(value: int) -> NumpyArrayObject:
+    data = np.array([value])
+    return NumpyArrayObject(syft_action_data=data, dtype=data.dtype, shape=data.shape)
+
+
+def make_context() -> Any:
+    return SimpleNamespace(
+        credentials=SyftSigningKey.generate().verify_key,
+        node=SimpleNamespace(id=UID()),
+    )
+
+
+def test_set_many_stores_all() -> None:
+    service = ActionService(store=DictActionStore())
+    context = make_context()
+    objs = [make_object(i) for i in range(3)]
+
+    result = service.set_many(context, objs)
+
+    assert result.is_ok()
+    assert len(result.ok()) == 3
+    assert all(service.store.exists(uid=obj.id) for obj in objs)
+
+
+def test_set_many_removes_created_objects_on_failure() -> None:
+    store = DictActionStore()
+    service = ActionService(store=store)
+    context = make_context()
+
+    # owned by someone else, so the call below may not overwrite it
+    foreign = make_object(0)
+    store.set(
+        uid=foreign.id,
+        credentials=SyftSigningKey.generate().verify_key,
+        syft_object=foreign,
+    )
+    first, second = make_object(1), make_object(2)
+
+    result = service.set_many(context, [first, foreign, second])
+
+    # an error string, as ActionService.set returns
+    assert isinstance(result, str)
+    assert not store.exists(uid=first.id)
+    assert not store.exists(uid=second.id)
+    assert store.exists(uid=foreign.id)
@@ -0,0 +1,99 @@
+# stdlib
+from types import SimpleNamespace
+from typing import Any
+from typing import List
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+from syft.core.common.serde.serialize import _serialize
+from syft.core.common.uid import UID
+from syft.core.node.new.api import SyftAPI
+from syft.core.node.new.api import SyftAPICall
+from syft.core.node.new.client import ASSET_UPLOAD_BATCH_NBYTES
+from syft.core.node.new.client import ASSET_UPLOAD_BATCH_SIZE
+from syft.core.node.new.client import HTTPConnection
+from syft.core.node.new.client import _asset_batches
+from syft.core.node.new.client import clear_connection_cache
+from syft.core.node.new.credentials import SyftSigningKey
+from syft.core.node.new.response import SyftSuccess
+
+
+@pytest.fixture
+def fetches(monkeypatch: Any) -> List[str]:
+    clear_connection_cache()
+    api_bytes = _serialize(SyftAPI(endpoints={}), to_bytes=True)
+    fetches: List[str] = []
+
+    def make_get(self: HTTPConnection, path: str) -> bytes:
+        fetches.append(path)
+        return api_bytes
+
+    monkeypatch.setattr(HTTPConnection, "_make_get", make_get)
+    monkeypatch.setattr(
+        HTTPConnection,
+        "make_call",
+        lambda self, signed_call: SyftSuccess(message="ok"),
+    )
+    yield fetches
+    clear_connection_cache()
+
+
+def test_get_api_returns_unshared_objects(fetches: List[str]) -> None:
+    credentials = SyftSigningKey.generate()
+    connection = HTTPConnection(url="http://localhost:8081")
+    proxy = connection.with_proxy(UID())
+
+    api = connection.get_api(credentials)
+    proxy_api = proxy.get_api(credentials)
+    cached_api = connection.get_api(credentials)
+
+    assert len(fetches) == 2
+    assert api is not cached_api
+    # binding one API must not rebind the others
+    assert api.connection is connection
+    assert cached_api.connection is connection
+    assert proxy_api.connection is proxy
+    assert api.node_uid != proxy_api.node_uid
+
+
+@pytest.mark.parametrize("path", ["code.submit", "request.apply"])
+def test_api_cache_cleared_after_code_changes(fetches: List[str], path: str) -> None:
+    credentials = SyftSigningKey.generate()
+    connection = HTTPConnection(url="http://localhost:8081")
+    api = connection.get_api(credentials)
+    connection.get_api(credentials)
+    assert len(fetches) == 1
+
+    api.make_call(SyftAPICall(node_uid=UID(), path=path, args=[], kwargs={}))
+
+    connection.get_api(credentials)
+    assert len(fetches) == 2
+
+
+def test_asset_batches_are_bounded() -> None:
+    small = [
+        SimpleNamespace(data=np.zeros(1), mock=np.zeros(1))
+        for _ in range(ASSET_UPLOAD_BATCH_SIZE * 2 + 1)
+    ]
+    batches = list(_asset_batches(small))
+    assert [len(batch) for batch in batches] == [
+        ASSET_UPLOAD_BATCH_SIZE,
+        ASSET_UPLOAD_BATCH_SIZE,
+        1,
+    ]
+
+    half = ASSET_UPLOAD_BATCH_NBYTES // 2
+    large = [
+        SimpleNamespace(data=np.zeros(half, dtype=np.uint8), mock=None)
+        for _ in range(3)
+    ]
+    # an asset larger than the byte bound still goes out, on its own
+    huge = SimpleNamespace(
+        data=np.zeros(ASSET_UPLOAD_BATCH_NBYTES + 1, dtype=np.uint8), mock=None
+    )
+    batches = list(_asset_batches(large + [huge]))
+    assert [len(batch) for batch in batches] == [2, 1, 1]
+    assert batches[-1] == [huge]
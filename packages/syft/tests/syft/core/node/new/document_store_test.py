@@ -0,0 +1,109 @@
+# stdlib
+from typing import Any
+from typing import List
+from typing import Optional
+
+# third party
+from pymongo import MongoClient as PyMongoClient
+import pytest
+
+# syft absolute
+from syft.core.common.serde.serializable import serializable
+from syft.core.common.uid import UID
+from syft.core.node.common.node_table.syft_object import SYFT_OBJECT_VERSION_1
+from syft.core.node.common.node_table.syft_object import SyftObject
+from syft.core.node.new.dict_document_store import DictDocumentStore
+from syft.core.node.new.document_store import BaseUIDStoreStash
+from syft.core.node.new.document_store import DocumentStore
+from syft.core.node.new.document_store import PartitionKey
+from syft.core.node.new.document_store import PartitionSettings
+from syft.core.node.new.document_store import QueryKeys
+from syft.core.node.new.mongo_client import MongoClientCache
+from syft.core.node.new.mongo_client import MongoStoreClientConfig
+from syft.core.node.new.mongo_document_store import MongoDocumentStore
+from syft.core.node.new.mongo_document_store import MongoStoreConfig
+
+GroupPartitionKey = PartitionKey.intern(key="group", type_=str)
+
+
+@serializable(recursive_serde=True)
+class MockStoreObject(SyftObject):
+    __canonical_name__ = "MockStoreObject"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    id: UID
+    name: str
+    group: str
+
+    __attr_searchable__ = ["group"]
+    __attr_unique__ = ["name"]
+
+
+class MockStoreObjectStash(BaseUIDStoreStash):
+    object_type = MockStoreObject
+    settings: PartitionSettings = PartitionSettings(
+        name=MockStoreObject.__canonical_name__, object_type=MockStoreObject
+    )
+
+
+def make_mongo_store() -> DocumentStore:
+    # the in-memory server started by conftest.py
+    client_config = MongoStoreClientConfig(
+        hostname="localhost", port=27017, username="", password=""
+    )
+    MongoClientCache.set_cache(
+        config=client_config,
+        client=PyMongoClient(port=27017, uuidRepresentation="standard"),
+    )
+    store_config = MongoStoreConfig(
+        client_config=client_config, db_name=f"test_{UID().no_dash}"
+    )
+    return MongoDocumentStore(store_config=store_config)
+
+
+@pytest.fixture(params=["kv", "mongo"])
+def stash(request: Any) -> MockStoreObjectStash:
+    store = DictDocumentStore() if request.param == "kv" else make_mongo_store()
+    stash = MockStoreObjectStash(store=store)
+    for i in range(3):
+        stash.set(MockStoreObject(id=UID(), name=f"a{i}", group="a"))
+    stash.set(MockStoreObject(id=UID(), name="b0", group="b"))
+    return stash
+
+
+def spy_on_limit(stash: MockStoreObjectStash) -> List[Optional[int]]:
+    limits: List[Optional[int]] = []
+    find = stash.partition.find_index_or_search_keys
+
+    def find_with_spy(*args: Any, **kwargs: Any) -> Any:
+        limits.append(kwargs.get("limit", None))
+        return find(*args, **kwargs)
+
+    stash.partition.find_index_or_search_keys = find_with_spy
+    return limits
+
+
+def test_query_one_returns_match(stash: MockStoreObjectStash) -> None:
+    limits = spy_on_limit(stash)
+    qks = QueryKeys(qks=[GroupPartitionKey.with_obj("b")])
+
+    obj = stash.query_one(qks=qks).ok()
+
+    assert isinstance(obj, MockStoreObject)
+    assert obj.name == "b0"
+    assert limits == [1]
+
+
+def test_query_one_no_match(stash: MockStoreObjectStash) -> None:
+    qks = QueryKeys(qks=[GroupPartitionKey.with_obj("c")])
+
+    assert stash.query_one(qks=qks).ok() is None
+
+
+def test_query_all_applies_limit(stash: MockStoreObjectStash) -> None:
+    qks = QueryKeys(qks=[GroupPartitionKey.with_obj("a")])
+
+    assert len(stash.query_all(qks=qks).ok()) == 3
+    limited = stash.query_all(qks=qks, limit=1).ok()
+    assert len(limited) == 1
+    assert limited[0].group == "a"
@@ -0,0 +1,89 @@
+# stdlib
+from types import SimpleNamespace
+from typing import Any
+from typing import Dict
+from typing import List
+
+# third party
+from result import Err
+from result import Ok
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.node.new.response import SyftError
+from syft.core.node.new.user_code import OutputPolicyStateExecuteCount
+from syft.core.node.new.user_code_service import UserCodeService
+
+
+class FakeUserCodeStash:
+    def __init__(self, code_items: List[Any]) -> None:
+        self.code_items = {code_item.id: code_item for code_item in code_items}
+        # the count written by each update, in order
+        self.persisted: List[int] = []
+
+    def get_by_uid(self, uid: UID) -> Ok:
+        return Ok(self.code_items.get(uid, None))
+
+    def update(self, code_item: Any) -> Ok:
+        self.persisted.append(code_item.output_policy_state.count)
+        return Ok(code_item)
+
+
+class FakeActionService:
+    def __init__(self, fail_on: Dict[int, str]) -> None:
+        self.fail_on = fail_on
+        self.executed = 0
+
+    def _user_code_execute(self, context: Any, code_item: Any, kwargs: Any) -> Any:
+        self.executed += 1
+        if self.executed in self.fail_on:
+            return Err(self.fail_on[self.executed])
+        return Ok(kwargs["x"] * 2)
+
+
+def make_service(limit: int, fail_on: Dict[int, str]) -> Any:
+    code_item = SimpleNamespace(
+        id=UID(), output_policy_state=OutputPolicyStateExecuteCount(limit=limit)
+    )
+    service = UserCodeService.__new__(UserCodeService)
+    service.stash = FakeUserCodeStash([code_item])
+    action_service = FakeActionService(fail_on=fail_on)
+    context = SimpleNamespace(
+        node=SimpleNamespace(get_service=lambda name: action_service)
+    )
+    return service, context, code_item
+
+
+def test_call_many_enforces_limit_across_batch() -> None:
+    service, context, code_item = make_service(limit=2, fail_on={})
+
+    results = service.call_many(context, [(code_item.id, {"x": x}) for x in range(4)])
+
+    assert results[:2] == [0, 2]
+    assert all(isinstance(result, SyftError) for result in results[2:])
+    assert code_item.output_policy_state.count == 2
+    # every successful call is written before the next one runs
+    assert service.stash.persisted == [1, 2]
+
+
+def test_call_many_keeps_results_on_partial_failure() -> None:
+    service, context, code_item = make_service(limit=5, fail_on={2: "boom"})
+
+    results = service.call_many(context, [(code_item.id, {"x": x}) for x in range(3)])
+
+    assert results[0] == 0
+    assert isinstance(results[1], SyftError)
+    assert "boom" in results[1].message
+    assert results[2] == 4
+    assert code_item.output_policy_state.count == 2
+    assert service.stash.persisted == [1, 2]
+
+
+def test_call_many_unknown_uid_does_not_discard_results() -> None:
+    service, context, code_item = make_service(limit=5, fail_on={})
+
+    results = service.call_many(context, [(code_item.id, {"x": 1}), (UID(), {"x": 2})])
+
+    assert results[0] == 2
+    assert isinstance(results[1], SyftError)
+    assert service.stash.persisted == [1]
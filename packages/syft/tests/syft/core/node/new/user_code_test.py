@@ -0,0 +1,105 @@
+# stdlib
+import ast
+import hashlib
+from typing import Tuple
+
+# third party
+from pydantic import validate_model
+import pytest
+
+# syft absolute
+from syft.core.node.new.user_code import UserCode
+from syft.core.node.new.user_code import _process_code
+from syft.core.node.new.user_code import _wrap_with_ast
+from syft.core.node.new.user_code import compute_code_hash
+
+PLAIN = """def f(x, y):
+    return x + y
+"""
+
+DECORATED = """@some_decorator(a=1)
+@other_decorator
+def f(x):
+    z = {"a": x, "b": x + 1}
+    return z
+"""
+
+TAB_INDENTED = """def f(x):
+\tif x:
+\t\treturn {"a": 1}
+\treturn {"a": 2}
+"""
+
+
+def wrap_with_ast(
+    raw_code: str, input_kwargs: Tuple[str, ...], outputs: Tuple[str, ...]
+) -> str:
+    tree = ast.parse(raw_code)
+    tree.body[0].decorator_list = []
+    return _wrap_with_ast(
+        tree=tree,
+        func_name="wrapped",
+        original_func_name="f",
+        input_kwargs=input_kwargs,
+        outputs=outputs,
+    )
+
+
+@pytest.mark.parametrize(
+    "raw_code,input_kwargs,outputs",
+    [
+        (PLAIN, ("x", "y"), ()),
+        (DECORATED, ("x",), ()),
+        (DECORATED, ("x",), ("a",)),
+        (TAB_INDENTED, ("x",), ("a",)),
+    ],
+)
+def test_process_code_matches_ast_wrapper(
+    raw_code: str, input_kwargs: Tuple[str, ...], outputs: Tuple[str, ...]
+) -> None:
+    processed = _process_code(
+        raw_code=raw_code,
+        func_name="wrapped",
+        original_func_name="f",
+        input_kwargs=input_kwargs,
+        outputs=outputs,
+    )
+    expected = wrap_with_ast(raw_code, input_kwargs, outputs)
+
+    assert ast.dump(ast.parse(processed)) == ast.dump(ast.parse(expected))
+
+
+def test_process_code_tab_indented_runs() -> None:
+    processed = _process_code(
+        raw_code=TAB_INDENTED,
+        func_name="wrapped",
+        original_func_name="f",
+        input_kwargs=("x",),
+        outputs=("a",),
+    )
+    namespace = {}
+    exec("from typing import Any, Dict\n" + processed, namespace)  # nosec
+
+    assert namespace["wrapped"](x=True) == {"a": 1}
+    assert namespace["wrapped"](x=False) == {"a": 2}
+
+
+def test_compute_code_hash_fits_bson_int64() -> None:
+    code_hash = compute_code_hash(PLAIN)
+    assert isinstance(code_hash, int)
+    assert 0 <= code_hash < 2**63
+    assert compute_code_hash(PLAIN) == code_hash
+    assert compute_code_hash(DECORATED) != code_hash
+
+
+def test_hex_code_hash_is_rehashed_on_load() -> None:
+    # the form UserCode records were stored with before code_hash was an int
+    hex_hash = hashlib.sha256(PLAIN.encode("utf8")).hexdigest()
+
+    values, _, _ = validate_model(UserCode, {"raw_code": PLAIN, "code_hash": hex_hash})
+    assert values["code_hash"] == compute_code_hash(PLAIN)
+
+    values, _, _ = validate_model(
+        UserCode, {"raw_code": PLAIN, "code_hash": compute_code_hash(PLAIN)}
+    )
+    assert values["code_hash"] == compute_code_hash(PLAIN)
@@ -1,3 +1,7 @@
+# stdlib
+from types import SimpleNamespace
+from typing import Any
+
 # third party
 from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
@@ -5,6 +9,7 @@ import pytest
 
 # syft absolute
 import syft as sy
+from syft.core.common.uid import UID
 from syft.core.node.common.node_service.auth import AuthorizationException
 
 
@@ -42,3 +47,35 @@ def test_send_message_from_device_client_to_device() -> None:
         bob_phone_client.send_immediate_msg_without_reply(
             msg=sy.ReprMessage(address=bob_phone_client.node_uid)
         )
+
+
+def test_add_routes_batch_skips_bad_routes(
+    node: sy.VirtualMachine, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(node, "_do_connect", lambda grid_url: grid_url.base_url)
+    routes = [
+        SimpleNamespace(
+            protocol="ftp", host_or_ip="a.example", port=21, is_vpn=False, private=False
+        ),
+        SimpleNamespace(
+            protocol="http",
+            host_or_ip="b.example",
+            port=80,
+            is_vpn=False,
+            private=False,
+        ),
+        SimpleNamespace(
+            protocol="https",
+            host_or_ip="c.example",
+            port=443,
+            is_vpn=False,
+            private=False,
+        ),
+    ]
+    node_id = UID()
+
+    # the unknown protocol is skipped without losing the other routes
+    node._add_routes_batch(node_id=node_id, node_name="peer", routes=routes)
+
+    peer_clients = node._peer_clients[node_id]
+    assert [priority for priority, _, _ in peer_clients] == [1, 2]